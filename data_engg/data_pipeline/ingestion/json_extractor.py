@@ -3,13 +3,14 @@ JSON Data Extractor for SEC Company Facts
 Extracts and normalizes data from SEC company facts JSON files
 """
 
-import json
 import os
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker
 
 # Import database models and config
@@ -18,12 +19,57 @@ import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 from database.config.config import Config
 from database.models.sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
-from database.db_connection import engine
+from database.db_connection import get_engine
+
+# orjson parses SEC facts blobs several times faster than stdlib json; fall back
+# to json when it isn't installed (both loads() accept bytes)
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Insert statements used by save_to_database, built once at import.
+# Dictionary rows are idempotent (INSERT ... ON DUPLICATE KEY UPDATE);
+# created_at/updated_at come from the column defaults
+DICT_INSERT_SQL = text(
+    """
+    INSERT INTO bronze_sec_facts_dict
+    (taxonomy, tag, label, description)
+    VALUES (:taxonomy, :tag, :label, :description)
+    ON DUPLICATE KEY UPDATE
+        label = VALUES(label),
+        description = VALUES(description),
+        updated_at = CURRENT_TIMESTAMP
+"""
+)
+FACTS_INSERT_SQL = text(
+    """
+    INSERT INTO bronze_sec_facts
+    (cik, taxonomy, tag, unit, val, fy, fp, start_date, end_date, frame, form, filed, accn)
+    VALUES (:cik, :taxonomy, :tag, :unit, :val, :fy, :fp, :start_date, :end_date, :frame, :form, :filed, :accn)
+"""
+)
+
+def _parse_json_file(filepath: Path) -> List[tuple]:
+    """
+    Loads and normalizes one facts file inside a parser worker process.
+    Only calls SECFactsExtractor's static parsing helpers, so no extractor,
+    engine or session is built in the worker.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        List of normalized (record_type, record_data) tuples
+    """
+    cik = SECFactsExtractor.extract_cik_from_filename(filepath)
+    json_data = SECFactsExtractor.load_json_file(filepath)
+    return SECFactsExtractor.normalize_facts_data(json_data, cik)
+
 
 class SECFactsExtractor:
     """Extract and normalize SEC company facts from JSON files"""
@@ -38,7 +84,7 @@ class SECFactsExtractor:
         """
         self.json_directory = Path(json_directory)
         self.db_config = db_config
-        self.engine = engine
+        self.engine = get_engine()
         self.Session = sessionmaker(bind=self.engine)
 
     def scan_json_files(self) -> List[Path]:
@@ -52,7 +98,8 @@ class SECFactsExtractor:
         json_files = list(self.json_directory.glob("*.json"))
         return json_files
 
-    def extract_cik_from_filename(self, filepath: Path) -> str:
+    @staticmethod
+    def extract_cik_from_filename(filepath: Path) -> str:
         """
         Extracts the company CIK identifier from a JSON filename.
         Ensures that each data record is associated with the correct company.
@@ -69,7 +116,8 @@ class SECFactsExtractor:
         # Format as CIK0000000000 (padded to 10 digits)
         return f"CIK{int(cik_number):010d}"
 
-    def load_json_file(self, filepath: Path) -> Dict[str, Any]:
+    @staticmethod
+    def load_json_file(filepath: Path) -> Dict[str, Any]:
         """
         Reads and parses a single JSON file into memory.
         Handles file I/O and prepares the raw data for normalization.
@@ -81,15 +129,16 @@ class SECFactsExtractor:
             Parsed JSON data
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            with open(filepath, "rb") as f:
+                data = _json.loads(f.read())
             return data
         except Exception as e:
             logger.error(f"Error loading {filepath.name}: {str(e)}")
             raise
 
+    @classmethod
     def normalize_facts_data(
-        self, json_data: Dict[str, Any], cik: str
+        cls, json_data: Dict[str, Any], cik: str
     ) -> List[Dict[str, Any]]:
         """
         Transforms nested SEC company facts JSON into a flat, structured format.
@@ -150,14 +199,14 @@ class SECFactsExtractor:
                                 "taxonomy": taxonomy,
                                 "tag": tag,
                                 "unit": unit_type,
-                                "val": self._safe_float(data_point.get("val")),
-                                "fy": self._safe_int(data_point.get("fy")),
+                                "val": cls._safe_float(data_point.get("val")),
+                                "fy": cls._safe_int(data_point.get("fy")),
                                 "fp": data_point.get("fp"),
-                                "start_date": self._parse_date(data_point.get("start")),
-                                "end_date": self._parse_date(data_point.get("end")),
+                                "start_date": cls._parse_date(data_point.get("start")),
+                                "end_date": cls._parse_date(data_point.get("end")),
                                 "frame": data_point.get("frame"),
                                 "form": data_point.get("form"),
-                                "filed": self._parse_date(data_point.get("filed")),
+                                "filed": cls._parse_date(data_point.get("filed")),
                                 "accn": data_point.get("accn"),
                             }
                             normalized_records.append(("fact", fact_record))
@@ -168,7 +217,8 @@ class SECFactsExtractor:
             logger.error(f"Error normalizing data for CIK {cik}: {str(e)}")
             raise
 
-    def _safe_float(self, value: Any) -> Optional[float]:
+    @staticmethod
+    def _safe_float(value: Any) -> Optional[float]:
         """Safely convert value to float"""
         if value is None:
             return None
@@ -177,7 +227,8 @@ class SECFactsExtractor:
         except (ValueError, TypeError):
             return None
 
-    def _safe_int(self, value: Any) -> Optional[int]:
+    @staticmethod
+    def _safe_int(value: Any) -> Optional[int]:
         """Safely convert value to int"""
         if value is None:
             return None
@@ -186,7 +237,8 @@ class SECFactsExtractor:
         except (ValueError, TypeError):
             return None
 
-    def _parse_date(self, date_str: Any) -> Optional[datetime]:
+    @staticmethod
+    def _parse_date(date_str: Any) -> Optional[datetime]:
         """Parse date string to datetime object"""
         if not date_str:
             return None
@@ -231,21 +283,6 @@ class SECFactsExtractor:
 
                     # Process dictionary records with simple insert (INSERT ... ON DUPLICATE KEY UPDATE)
                     if dict_records:
-                        from sqlalchemy import text
-                        from datetime import datetime
-
-                        dict_insert_sql = text(
-                            """
-                            INSERT INTO bronze_sec_facts_dict 
-                            (taxonomy, tag, label, description, created_at, updated_at)
-                            VALUES (:taxonomy, :tag, :label, :description, :created_at, :updated_at)
-                            ON DUPLICATE KEY UPDATE
-                                label = VALUES(label),
-                                description = VALUES(description),
-                                updated_at = VALUES(updated_at)
-                        """
-                        )
-
                         # Insert dictionary records in batches with idempotent logic
                         for i in range(0, len(dict_records), batch_size):
                             batch = dict_records[i : i + batch_size]
@@ -256,30 +293,18 @@ class SECFactsExtractor:
                                     "tag": record.tag,
                                     "label": record.label,
                                     "description": record.description,
-                                    "created_at": datetime.utcnow(),
-                                    "updated_at": datetime.utcnow(),
                                 }
                                 for record in batch
                             ]
-                            session.execute(dict_insert_sql, batch_data)
+                            session.execute(DICT_INSERT_SQL, batch_data)
                             session.commit()
 
                     # Process facts records with raw SQL bulk insert (same as test_sec_fact.py)
                     if facts_data:
-                        from sqlalchemy import text
-
-                        insert_sql = text(
-                            """
-                            INSERT INTO bronze_sec_facts 
-                            (cik, taxonomy, tag, unit, val, fy, fp, start_date, end_date, frame, form, filed, accn)
-                            VALUES (:cik, :taxonomy, :tag, :unit, :val, :fy, :fp, :start_date, :end_date, :frame, :form, :filed, :accn)
-                        """
-                        )
-
                         # Insert facts in batches
                         for i in range(0, len(facts_data), batch_size):
                             batch = facts_data[i : i + batch_size]
-                            session.execute(insert_sql, batch)
+                            session.execute(FACTS_INSERT_SQL, batch)
                             session.commit()
 
                     return  # Success - exit the retry loop
@@ -308,7 +333,25 @@ class SECFactsExtractor:
         Returns:
             Dictionary with processing statistics
         """
+        result, _ = self.process_single_file_with_records(filepath)
+        return result
+
+    def process_single_file_with_records(
+        self, filepath: Path
+    ) -> Tuple[Dict[str, int], List[tuple]]:
+        """
+        Same pipeline as process_single_file, but also returns the normalized records
+        so callers that need them don't have to reload and re-normalize the file.
+
+        Args:
+            filepath: Path to JSON file
+
+        Returns:
+            Tuple of (processing statistics, normalized records); the records are
+            still returned when only the database save failed
+        """
         cik = self.extract_cik_from_filename(filepath)
+        normalized_records = []
 
         try:
             # Load JSON data
@@ -320,55 +363,94 @@ class SECFactsExtractor:
             # Save to database
             self.save_to_database(normalized_records)
 
-            fact_count = sum(1 for r_type, _ in normalized_records if r_type == "fact")
-            dict_count = sum(1 for r_type, _ in normalized_records if r_type == "dict")
-
-            return {
-                "cik": cik,
-                "fact_records": fact_count,
-                "dict_records": dict_count,
-                "total_records": len(normalized_records),
-                "status": "success",
-            }
+            return self._success_result(cik, normalized_records), normalized_records
 
         except Exception as e:
             logger.error(f"Error processing {filepath.name}: {str(e)}")
-            return {
-                "cik": cik,
-                "fact_records": 0,
-                "dict_records": 0,
-                "total_records": 0,
-                "status": "error",
-                "error": str(e),
-            }
-
-    def process_json_batch(self, filepaths: List[Path]) -> List[Dict[str, int]]:
+            return self._error_result(cik, e), normalized_records
+
+    @staticmethod
+    def _success_result(cik: str, normalized_records: List[tuple]) -> Dict[str, Any]:
+        """Build the statistics dictionary for a successfully saved file"""
+        fact_count = sum(1 for r_type, _ in normalized_records if r_type == "fact")
+        dict_count = len(normalized_records) - fact_count
+
+        return {
+            "cik": cik,
+            "fact_records": fact_count,
+            "dict_records": dict_count,
+            "total_records": len(normalized_records),
+            "status": "success",
+        }
+
+    @staticmethod
+    def _error_result(cik: str, error: Exception) -> Dict[str, Any]:
+        """Build the statistics dictionary for a file that failed to process"""
+        return {
+            "cik": cik,
+            "fact_records": 0,
+            "dict_records": 0,
+            "total_records": 0,
+            "status": "error",
+            "error": str(error),
+        }
+
+    def process_json_batch(
+        self, filepaths: List[Path], max_workers: Optional[int] = None
+    ) -> List[Dict[str, int]]:
         """
         Processes a list of file paths as a batch.
-        Loops through each file and calls the full single-file pipeline for each.
+        JSON loading and normalization (CPU-bound) run on a process pool while this
+        process writes each parsed file to the database (I/O-bound), so parsing of
+        the next files overlaps the inserts. At most 2 * max_workers parsed files
+        are held in memory at once.
         Used in batch-based orchestration (e.g. Airflow).
 
         Args:
             filepaths: List of Path objects for JSON files to process
+            max_workers: Number of parser processes (defaults to CPU count)
 
         Returns:
-            List of processing statistics for each file
+            List of processing statistics for each file, in input order
         """
-        results = []
+        max_workers = max_workers or os.cpu_count() or 1
+        results: List[Optional[Dict[str, int]]] = [None] * len(filepaths)
+        pending = {}
+
+        def write(done):
+            # Save each parsed file from this process as soon as it is ready
+            for future in done:
+                index = pending.pop(future)
+                filepath = filepaths[index]
+                cik = self.extract_cik_from_filename(filepath)
+
+                try:
+                    normalized_records = future.result()
+                    self.save_to_database(normalized_records)
+                    result = self._success_result(cik, normalized_records)
+                except Exception as e:
+                    logger.error(f"Error processing {filepath.name}: {str(e)}")
+                    result = self._error_result(cik, e)
+
+                results[index] = result
+
+                # Log progress
+                if result["status"] != "success":
+                    logger.error(
+                        f"Failed to process {filepath.name}: {result.get('error', 'Unknown error')}"
+                    )
 
-        for filepath in filepaths:
-            result = self.process_single_file(filepath)
-            results.append(result)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for index, filepath in enumerate(filepaths):
+                pending[executor.submit(_parse_json_file, filepath)] = index
 
-            # Log progress
-            if result["status"] != "success":
-                logger.error(
-                    f"Failed to process {filepath.name}: {result.get('error', 'Unknown error')}"
-                )
+                # Bound parsed-but-unsaved files so memory stays flat
+                if len(pending) >= 2 * max_workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    write(done)
 
-        # Summary
-        successful = sum(1 for r in results if r["status"] == "success")
-        total_facts = sum(r["fact_records"] for r in results)
-        total_dicts = sum(r["dict_records"] for r in results)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                write(done)
 
         return results
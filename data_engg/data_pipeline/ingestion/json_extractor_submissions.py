@@ -3,9 +3,12 @@ JSON Data Extractor for SEC Submissions Facts
 Extracts and normalizes data from SEC submissions facts JSON files
 """
 
-import json
+import importlib
+import mmap
 import os
-from typing import Dict, List, Any, Optional
+import re
+from itertools import islice
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 from datetime import datetime
 from pathlib import Path
 
@@ -16,7 +19,71 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
 from database.config.config import Config
-from database.db_connection import engine
+from database.db_connection import get_engine
+
+# Bind the fastest available JSON parser once at import time; every backend
+# exposes a loads() that accepts bytes and returns plain dicts/lists
+for _json_backend in ("orjson", "simdjson", "ujson", "json"):
+    try:
+        _json_loads = importlib.import_module(_json_backend).loads
+        break
+    except ImportError:
+        continue
+
+# Files at least this large are memory-mapped instead of read into a bytes
+# buffer (only for orjson, which parses a memoryview without copying it)
+_MMAP_MIN_BYTES = 10 * 1024 * 1024
+
+# Filename stem of a submissions file: CIK0000001800 or
+# CIK0000001800-submissions-001 (the CIK prefix is optional)
+_CIK_STEM_PATTERN = re.compile(r"(?:CIK)?(\d+)(?:-submissions-\d+)?")
+
+# Column order of a normalized filing record (matches bronze_sec_submissions)
+_FILING_FIELDS = (
+    "cik",
+    "accession_number",
+    "filing_date",
+    "report_date",
+    "acceptance_datetime",
+    "act",
+    "form",
+    "file_number",
+    "film_number",
+    "items",
+    "size",
+    "is_xbrl",
+    "is_inline_xbrl",
+    "primary_document",
+    "primary_doc_description",
+)
+
+# Bulk INSERT ... ON DUPLICATE KEY UPDATE for idempotent filing loads.
+# Written in the DBAPI's pyformat style and executed on the raw PyMySQL cursor,
+# whose executemany() folds a single VALUES row into multi-row INSERT statements.
+_SUBMISSIONS_UPSERT_SQL = """
+    INSERT INTO bronze_sec_submissions
+    (cik, accession_number, filing_date, acceptance_datetime,
+     report_date, act, form, file_number, film_number, items,
+     size, is_xbrl, is_inline_xbrl, primary_document,
+     primary_doc_description)
+    VALUES
+    (%(cik)s, %(accession_number)s, %(filing_date)s, %(acceptance_datetime)s,
+     %(report_date)s, %(act)s, %(form)s, %(file_number)s, %(film_number)s, %(items)s,
+     %(size)s, %(is_xbrl)s, %(is_inline_xbrl)s, %(primary_document)s,
+     %(primary_doc_description)s)
+    ON DUPLICATE KEY UPDATE
+        report_date = VALUES(report_date),
+        act = VALUES(act),
+        form = VALUES(form),
+        file_number = VALUES(file_number),
+        film_number = VALUES(film_number),
+        items = VALUES(items),
+        size = VALUES(size),
+        is_xbrl = VALUES(is_xbrl),
+        is_inline_xbrl = VALUES(is_inline_xbrl),
+        primary_document = VALUES(primary_document),
+        primary_doc_description = VALUES(primary_doc_description)
+"""
 
 
 class SECSubmissionsExtractor:
@@ -32,7 +99,7 @@ class SECSubmissionsExtractor:
         """
         self.json_directory = Path(json_directory)
         self.db_config = db_config
-        self.engine = engine
+        self.engine = get_engine()
         self.Session = sessionmaker(bind=self.engine)
 
     def scan_json_files(self) -> List[Path]:
@@ -46,7 +113,8 @@ class SECSubmissionsExtractor:
         json_files = list(self.json_directory.glob("*.json"))
         return json_files
 
-    def extract_cik_from_filename(self, filepath: Path) -> str:
+    @staticmethod
+    def extract_cik_from_filename(filepath: Path) -> str:
         """
         Extracts the company CIK identifier from a JSON filename.
         Ensures that each data record is associated with the correct company.
@@ -62,19 +130,16 @@ class SECSubmissionsExtractor:
         Returns:
             Formatted CIK string (e.g., CIK0000001800)
         """
-        filename = filepath.stem  # Remove .json extension
-        cik_part = filename.replace("CIK", "")
-
-        # Handle submissions files like CIK0000001800-submissions-001
-        if "-submissions-" in cik_part:
-            cik_number = cik_part.split("-submissions-")[0]
-        else:
-            cik_number = cik_part
+        # One pass over the stem (.json removed) instead of chained replace/split
+        match = _CIK_STEM_PATTERN.fullmatch(filepath.stem)
+        if match is None:
+            raise ValueError(f"Unexpected submissions filename: {filepath.name}")
 
         # Format as CIK0000000000 (padded to 10 digits with CIK prefix)
-        return f"CIK{int(cik_number):010d}"
+        return f"CIK{int(match.group(1)):010d}"
 
-    def load_json_file(self, filepath: Path) -> Dict[str, Any]:
+    @staticmethod
+    def load_json_file(filepath: Path) -> Dict[str, Any]:
         """
         Reads and parses a single JSON file into memory.
         Handles file I/O and prepares the raw data for normalization.
@@ -86,30 +151,37 @@ class SECSubmissionsExtractor:
             Parsed JSON data
         """
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data
+            with open(filepath, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if _json_backend != "orjson" or file_size < _MMAP_MIN_BYTES:
+                    return _json_loads(f.read())
+
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    with memoryview(mm) as view:
+                        return _json_loads(view)
         except Exception as e:
             print(f"Error loading {filepath.name}: {str(e)}")
             raise
 
+    @classmethod
     def normalize_submissions_data(
-        self, json_data: Dict[str, Any], cik: str
-    ) -> List[Dict[str, Any]]:
+        cls, json_data: Dict[str, Any], cik: str
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
         Transforms SEC submissions JSON into a flat, structured format.
         Handles both nested (filings.recent) and direct array structures.
-        Returns only filing data with CIK.
+        Yields only filing data with CIK, one record at a time, so large files
+        never hold every normalized filing in memory.
 
         Args:
             json_data: Parsed JSON data
             cik: Company CIK
 
-        Returns:
-            List of normalized filing records
+        Yields:
+            ("filing", record) tuples
         """
-        normalized_records = []
-
         try:
             # Determine structure and extract data
             data_source = None
@@ -164,52 +236,47 @@ class SECSubmissionsExtractor:
                     if arr
                 )
 
+                # Integer columns are coerced column-wise up front
+                size_values = cls._coerce_int_column(sizes, max_length)
+                is_xbrl_values = cls._coerce_int_column(is_xbrl, max_length)
+                is_inline_xbrl_values = cls._coerce_int_column(
+                    is_inline_xbrl, max_length
+                )
+
                 for i in range(max_length):
-                    filing_record = {
-                        "cik": cik,
-                        "accession_number": self._safe_get(accession_numbers, i),
-                        "filing_date": self._parse_date(
-                            self._safe_get(filing_dates, i)
-                        ),
-                        "report_date": self._parse_date(
-                            self._safe_get(report_dates, i)
-                        ),
-                        "acceptance_datetime": self._parse_datetime(
-                            self._safe_get(acceptance_datetimes, i)
-                        ),
-                        "act": self._safe_get(acts, i),
-                        "form": self._safe_get(forms, i),
-                        "file_number": self._safe_get(file_numbers, i),
-                        "film_number": self._safe_numeric(
-                            self._safe_get(film_numbers, i)
-                        ),
-                        "items": self._safe_get(items, i),
-                        "size": self._safe_int(self._safe_get(sizes, i)),
-                        "is_xbrl": self._safe_int(self._safe_get(is_xbrl, i)),
-                        "is_inline_xbrl": self._safe_int(
-                            self._safe_get(is_inline_xbrl, i)
-                        ),
-                        "primary_document": self._safe_get(primary_documents, i),
-                        "primary_doc_description": self._safe_get(
-                            primary_doc_descriptions, i
-                        ),
-                    }
-                    normalized_records.append(("filing", filing_record))
-
-            return normalized_records
+                    values = (
+                        cik,
+                        cls._safe_get(accession_numbers, i),
+                        cls._parse_date(cls._safe_get(filing_dates, i)),
+                        cls._parse_date(cls._safe_get(report_dates, i)),
+                        cls._parse_datetime(cls._safe_get(acceptance_datetimes, i)),
+                        cls._safe_get(acts, i),
+                        cls._safe_get(forms, i),
+                        cls._safe_get(file_numbers, i),
+                        cls._safe_numeric(cls._safe_get(film_numbers, i)),
+                        cls._safe_get(items, i),
+                        size_values[i],
+                        is_xbrl_values[i],
+                        is_inline_xbrl_values[i],
+                        cls._safe_get(primary_documents, i),
+                        cls._safe_get(primary_doc_descriptions, i),
+                    )
+                    yield ("filing", dict(zip(_FILING_FIELDS, values)))
 
         except Exception as e:
             print(f"Error normalizing submissions data for CIK {cik}: {str(e)}")
             raise
 
-    def _safe_get(self, arr: List[Any], index: int) -> Optional[Any]:
+    @staticmethod
+    def _safe_get(arr: List[Any], index: int) -> Optional[Any]:
         """Safely get item from array at index"""
         try:
             return arr[index] if index < len(arr) else None
         except (IndexError, TypeError):
             return None
 
-    def _safe_int(self, value: Any) -> Optional[int]:
+    @staticmethod
+    def _safe_int(value: Any) -> Optional[int]:
         """Safely convert value to int"""
         if value is None or value == "":
             return None
@@ -218,7 +285,25 @@ class SECSubmissionsExtractor:
         except (ValueError, TypeError):
             return None
 
-    def _safe_numeric(self, value: Any) -> Optional[float]:
+    @classmethod
+    def _coerce_int_column(cls, arr: List[Any], length: int) -> List[Optional[int]]:
+        """
+        Convert a whole array with _safe_int semantics, padded with None to length.
+        SEC arrays are normally plain ints already, in which case they are reused
+        without a per-element conversion call.
+        """
+        if not isinstance(arr, list):
+            return [None] * length
+
+        if all(type(value) is int for value in arr):
+            values = arr[:length]
+        else:
+            values = [cls._safe_int(value) for value in arr[:length]]
+
+        return values + [None] * (length - len(values))
+
+    @staticmethod
+    def _safe_numeric(value: Any) -> Optional[float]:
         """Safely convert value to numeric (for database Numeric fields), return None if conversion fails"""
         if value is None or value == "":
             return None
@@ -239,7 +324,8 @@ class SECSubmissionsExtractor:
         except (ValueError, TypeError):
             return None
 
-    def _parse_date(self, date_str: Any) -> Optional[datetime]:
+    @staticmethod
+    def _parse_date(date_str: Any) -> Optional[datetime]:
         """Parse date string to datetime object"""
         if not date_str:
             return None
@@ -250,7 +336,8 @@ class SECSubmissionsExtractor:
         except (ValueError, TypeError):
             return None
 
-    def _parse_datetime(self, datetime_str: Any) -> Optional[datetime]:
+    @staticmethod
+    def _parse_datetime(datetime_str: Any) -> Optional[datetime]:
         """Parse datetime string to datetime object"""
         if not datetime_str:
             return None
@@ -264,149 +351,98 @@ class SECSubmissionsExtractor:
         except (ValueError, TypeError):
             return None
 
+    def upsert_filings(self, session, filing_records: List[Dict[str, Any]]):
+        """
+        Executes the bulk upsert for one batch of filing records on an open session.
+        Runs on the session's DBAPI cursor to skip SQLAlchemy statement handling,
+        but stays inside the session transaction, so callers decide when to commit.
+
+        Args:
+            session: Open SQLAlchemy session
+            filing_records: Filing record dicts keyed by the statement's bind names
+        """
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.executemany(_SUBMISSIONS_UPSERT_SQL, filing_records)
+        finally:
+            cursor.close()
+
+    def _iter_filings(
+        self,
+        normalized_records: Iterable[Tuple[str, Dict[str, Any]]],
+        record_counts: Dict[str, int],
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield filing records while tallying every record type into record_counts"""
+        for record_type, record_data in normalized_records:
+            record_counts[record_type] = record_counts.get(record_type, 0) + 1
+            if record_type == "filing":
+                yield record_data
+
     def save_to_database(
         self,
-        normalized_records: List[tuple],
+        normalized_records: Iterable[Tuple[str, Dict[str, Any]]],
         batch_size: int = 10000,
         max_retries: int = 3,
-    ):
+    ) -> Dict[str, int]:
         """
         Persists normalized records into the database.
+        Records are consumed lazily and batched with islice, so a generator from
+        normalize_submissions_data is never materialized in full.
 
         Args:
-            normalized_records: List of (record_type, record_data) tuples
+            normalized_records: Iterable of (record_type, record_data) tuples
             batch_size: Number of records to process in each batch
             max_retries: Maximum number of retry attempts for database operations
+
+        Returns:
+            Number of records consumed, by record type
         """
+        record_counts = {}
+
         if not self.db_config:
             print("Database save not implemented yet for submissions data")
-            print(f"Would save {len(normalized_records)} records to database")
 
             # Count records by type
-            record_counts = {}
-            for record_type, _ in normalized_records:
-                record_counts[record_type] = record_counts.get(record_type, 0) + 1
+            for _ in self._iter_filings(normalized_records, record_counts):
+                pass
 
+            print(f"Would save {sum(record_counts.values())} records to database")
             for record_type, count in record_counts.items():
                 print(f"  {record_type}: {count} records")
-            return
+            return record_counts
 
         try:
             from database.db_connection import Session
-            from database.models.sec_submissions_raw import BronzeSecSubmissions
-            from sqlalchemy import text
-
-            print(f"Saving {len(normalized_records)} records to database")
-
-            # Separate records by type
-            filing_records = []
-            for record_type, record_data in normalized_records:
-                if record_type == "filing":
-                    filing_records.append(record_data)
-
-            if filing_records:
-                print(f"Inserting {len(filing_records)} filing records...")
-
-                with Session() as session:
-                    try:
-                        # Insert filing records in batches
-                        for i in range(0, len(filing_records), batch_size):
-                            batch = filing_records[i : i + batch_size]
-
-                            # Convert to SQLAlchemy objects
-                            submission_objects = []
-
-                            for record in batch:
-                                submission_obj = BronzeSecSubmissions(
-                                    cik=record["cik"],
-                                    accession_number=record["accession_number"],
-                                    filing_date=record["filing_date"],
-                                    report_date=record["report_date"],
-                                    acceptance_datetime=record["acceptance_datetime"],
-                                    act=record["act"],
-                                    form=record["form"],
-                                    file_number=record["file_number"],
-                                    film_number=record["film_number"],
-                                    items=record["items"],
-                                    size=record["size"],
-                                    is_xbrl=record["is_xbrl"],
-                                    is_inline_xbrl=record["is_inline_xbrl"],
-                                    primary_document=record["primary_document"],
-                                    primary_doc_description=record[
-                                        "primary_doc_description"
-                                    ],
-                                )
-                                submission_objects.append(submission_obj)
-
-                            # Use bulk INSERT ... ON DUPLICATE KEY UPDATE for idempotency
-                            stmt = text(
-                                """
-                                INSERT INTO bronze_sec_submissions 
-                                (cik, accession_number, filing_date, acceptance_datetime, 
-                                 report_date, act, form, file_number, film_number, items, 
-                                 size, is_xbrl, is_inline_xbrl, primary_document, 
-                                 primary_doc_description)
-                                VALUES 
-                                (:cik, :accession_number, :filing_date, :acceptance_datetime,
-                                 :report_date, :act, :form, :file_number, :film_number, :items,
-                                 :size, :is_xbrl, :is_inline_xbrl, :primary_document,
-                                 :primary_doc_description)
-                                ON DUPLICATE KEY UPDATE
-                                    report_date = VALUES(report_date),
-                                    act = VALUES(act),
-                                    form = VALUES(form),
-                                    file_number = VALUES(file_number),
-                                    film_number = VALUES(film_number),
-                                    items = VALUES(items),
-                                    size = VALUES(size),
-                                    is_xbrl = VALUES(is_xbrl),
-                                    is_inline_xbrl = VALUES(is_inline_xbrl),
-                                    primary_document = VALUES(primary_document),
-                                    primary_doc_description = VALUES(primary_doc_description)
-                            """
-                            )
-
-                            # Prepare bulk data for executemany
-                            bulk_data = []
-                            for submission_obj in submission_objects:
-                                bulk_data.append(
-                                    {
-                                        "cik": submission_obj.cik,
-                                        "accession_number": submission_obj.accession_number,
-                                        "filing_date": submission_obj.filing_date,
-                                        "acceptance_datetime": submission_obj.acceptance_datetime,
-                                        "report_date": submission_obj.report_date,
-                                        "act": submission_obj.act,
-                                        "form": submission_obj.form,
-                                        "file_number": submission_obj.file_number,
-                                        "film_number": submission_obj.film_number,
-                                        "items": submission_obj.items,
-                                        "size": submission_obj.size,
-                                        "is_xbrl": submission_obj.is_xbrl,
-                                        "is_inline_xbrl": submission_obj.is_inline_xbrl,
-                                        "primary_document": submission_obj.primary_document,
-                                        "primary_doc_description": submission_obj.primary_doc_description,
-                                    }
-                                )
-
-                            # Execute bulk insert with ON DUPLICATE KEY UPDATE
-                            session.execute(stmt, bulk_data)
-
-                            session.commit()
-                            print(
-                                f"Processed batch {i//batch_size + 1}: {len(batch)} records (insert/update)"
-                            )
-
-                    except Exception as e:
-                        session.rollback()
-                        print(f"Error inserting submissions records: {e}")
-                        raise
-
-            print(f"Successfully saved {len(normalized_records)} records to database")
+
+            filings = self._iter_filings(normalized_records, record_counts)
+
+            with Session() as session:
+                try:
+                    # Insert filing records in batches
+                    batch_num = 0
+                    while batch := list(islice(filings, batch_size)):
+                        batch_num += 1
+
+                        self.upsert_filings(session, batch)
+                        session.commit()
+                        print(
+                            f"Processed batch {batch_num}: {len(batch)} records (insert/update)"
+                        )
+
+                except Exception as e:
+                    session.rollback()
+                    print(f"Error inserting submissions records: {e}")
+                    raise
+
+            print(
+                f"Successfully saved {sum(record_counts.values())} records to database"
+            )
+            return record_counts
 
         except ImportError as e:
             print(f"Database modules not available: {e}")
             print("Skipping database save")
+            return record_counts
         except Exception as e:
             print(f"Error saving to database: {e}")
             raise
@@ -431,21 +467,13 @@ class SECSubmissionsExtractor:
             # Normalize data
             normalized_records = self.normalize_submissions_data(json_data, cik)
 
-            # Save to database (currently just logs)
-            self.save_to_database(normalized_records)
-
-            # Count records by type
-            record_counts = {}
-            submission_records = 0
-            for record_type, _ in normalized_records:
-                record_counts[record_type] = record_counts.get(record_type, 0) + 1
-                if record_type == "filing":
-                    submission_records += 1
+            # Save to database; records are counted as they are consumed
+            record_counts = self.save_to_database(normalized_records)
 
             return {
                 "cik": cik,
-                "submission_records": submission_records,
-                "total_records": len(normalized_records),
+                "submission_records": record_counts.get("filing", 0),
+                "total_records": sum(record_counts.values()),
                 "record_counts": record_counts,
                 "status": "success",
             }
@@ -494,3 +522,104 @@ class SECSubmissionsExtractor:
         )
 
         return results
+
+    def process_files_streaming(
+        self, filepaths: List[Path], batch_size: int = 10000
+    ) -> List[Dict[str, int]]:
+        """
+        Processes many files through a single database session.
+        Filing records from consecutive files are buffered and upserted once
+        batch_size rows have accumulated, so the number of commits scales with
+        the row count instead of the file count.
+
+        Args:
+            filepaths: List of Path objects for JSON files to process
+            batch_size: Number of buffered filing records that triggers a flush
+
+        Returns:
+            List of processing statistics for each file
+        """
+        results = []
+        buffer = []
+        pending_results = []
+
+        with self.Session() as session:
+            for filepath in filepaths:
+                cik = None
+
+                try:
+                    cik = self.extract_cik_from_filename(filepath)
+                    json_data = self.load_json_file(filepath)
+                    normalized_records = self.normalize_submissions_data(json_data, cik)
+
+                    record_counts = {}
+                    filings = list(
+                        self._iter_filings(normalized_records, record_counts)
+                    )
+                except Exception as e:
+                    print(f"Error processing {filepath.name}: {str(e)}")
+                    results.append(
+                        {
+                            "cik": cik,
+                            "submission_records": 0,
+                            "total_records": 0,
+                            "record_counts": {},
+                            "status": "error",
+                            "error": str(e),
+                        }
+                    )
+                    continue
+
+                buffer.extend(filings)
+
+                result = {
+                    "cik": cik,
+                    "submission_records": record_counts.get("filing", 0),
+                    "total_records": sum(record_counts.values()),
+                    "record_counts": record_counts,
+                    "status": "success",
+                }
+                results.append(result)
+                pending_results.append(result)
+
+                if len(buffer) >= batch_size:
+                    self._flush_filings(session, buffer, pending_results, batch_size)
+
+            if buffer:
+                self._flush_filings(session, buffer, pending_results, batch_size)
+
+        successful = sum(1 for r in results if r["status"] == "success")
+        total_records = sum(r["total_records"] for r in results)
+
+        print(
+            f"Processed {len(results)} files: {successful} successful, {total_records} total records"
+        )
+
+        return results
+
+    def _flush_filings(
+        self,
+        session,
+        buffer: List[Dict[str, Any]],
+        pending_results: List[Dict[str, Any]],
+        batch_size: int,
+    ):
+        """
+        Upserts the buffered filing records and commits them in one transaction.
+        On failure the transaction is rolled back and every file with records in
+        the buffer is marked as failed. Both lists are cleared afterwards.
+        """
+        try:
+            for i in range(0, len(buffer), batch_size):
+                self.upsert_filings(session, buffer[i : i + batch_size])
+            session.commit()
+            print(f"Flushed {len(buffer)} filing records (insert/update)")
+        except Exception as e:
+            session.rollback()
+            print(f"Error inserting submissions records: {e}")
+            for result in pending_results:
+                result["status"] = "error"
+                result["error"] = str(e)
+        finally:
+            buffer.clear()
+            pending_results.clear()
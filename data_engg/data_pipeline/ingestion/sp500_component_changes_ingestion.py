@@ -6,6 +6,8 @@ from typing import Dict, List, Any
 import argparse
 from datetime import datetime
 
+from sqlalchemy import text
+
 # Add parent directories to path for imports - system independent
 current_dir = Path(__file__).parent.absolute()
 data_engg_root = current_dir.parent.parent  # Go up to data_engg/
@@ -14,7 +16,7 @@ sys.path.insert(0, str(data_engg_root))
 try:
     from database.config.config import Config
     from database.db_connection import engine, Session
-    from database.create_tables import (
+    from database.models.sp500_raw import (
         Sp500ComponentChanges,
     )  # Import the model for the target table
 
@@ -42,9 +44,9 @@ def validate_csv_structure(df: pd.DataFrame) -> bool:
     print(f"Actual columns: {list(df.columns)}")
 
     # Check if all expected columns exist
-    missing_columns = [col for col in expected_columns if col not in df.columns]
+    missing_columns = set(expected_columns).difference(df.columns)
     if missing_columns:
-        print(f"✗ Missing columns: {missing_columns}")
+        print(f"✗ Missing columns: {sorted(missing_columns)}")
         return False
 
     print("✓ CSV structure validation passed")
@@ -142,13 +144,9 @@ def bulk_insert_data(
                     # Convert DataFrame to list of dictionaries
                     batch_records = batch_df.to_dict("records")
 
-                    # Create model instances
-                    model_instances = []
-                    for record in batch_records:
-                        model_instances.append(Sp500ComponentChanges(**record))
-
-                    # Bulk insert using SQLAlchemy
-                    session.bulk_save_objects(model_instances)
+                    # Core executemany insert without building ORM objects;
+                    # PyMySQL rewrites it into multi-row INSERT statements
+                    session.execute(Sp500ComponentChanges.__table__.insert(), batch_records)
                     session.commit()
 
                     successful_inserts += len(batch_records)
@@ -228,8 +226,8 @@ def main():
 
     # Test database connection
     try:
-        with Session() as session:
-            session.execute("SELECT 1")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         print("✓ Database connection successful")
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
@@ -14,7 +14,7 @@ sys.path.insert(0, str(data_engg_root))
 try:
     from database.config.config import Config
     from database.db_connection import engine, Session
-    from database.create_tables import (
+    from database.models.sp500_raw import (
         Sp500CorporateActions,
     )  # Import the model for the target table
 
@@ -39,9 +39,9 @@ def validate_csv_structure(df: pd.DataFrame) -> bool:
     ]
 
     # Check if all expected columns exist
-    missing_columns = [col for col in expected_columns if col not in df.columns]
+    missing_columns = set(expected_columns).difference(df.columns)
     if missing_columns:
-        print(f"✗ Missing columns: {missing_columns}")
+        print(f"✗ Missing columns: {sorted(missing_columns)}")
         return False
 
     print("✓ CSV structure validation passed")
@@ -52,29 +52,26 @@ def clean_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and prepare the data for insertion"""
     print("Cleaning data...")
 
-    # Create a copy to avoid modifying the original
-    df_clean = df.copy()
+    # Convert columns in place - the raw frame is not reused by the caller
 
     # Convert date columns
     date_columns = ["ex_date", "record_date", "pay_date"]
     for col in date_columns:
-        if col in df_clean.columns:
-            df_clean[col] = pd.to_datetime(df_clean[col], errors="coerce")
+        if col in df.columns:
+            df[col] = pd.to_datetime(df[col], errors="coerce")
 
     # Convert cash_amount to numeric
-    if "cash_amount" in df_clean.columns:
-        df_clean["cash_amount"] = pd.to_numeric(
-            df_clean["cash_amount"], errors="coerce"
-        )
+    if "cash_amount" in df.columns:
+        df["cash_amount"] = pd.to_numeric(df["cash_amount"], errors="coerce")
 
     # Clean string columns
     string_columns = ["symbol", "event_type", "ratio"]
     for col in string_columns:
-        if col in df_clean.columns:
-            df_clean[col] = df_clean[col].astype(str).str.strip()
+        if col in df.columns:
+            df[col] = df[col].astype(str).str.strip()
 
     # Remove rows where symbol is null or empty
-    df_clean = df_clean.dropna(subset=["symbol"])
+    df_clean = df.dropna(subset=["symbol"])
     df_clean = df_clean[df_clean["symbol"] != ""]
 
     print(f"✓ Data cleaned. {len(df_clean)} records remaining after cleaning")
@@ -96,31 +93,25 @@ def insert_data_to_database(df: pd.DataFrame, session: Session) -> bool:
             session.query(Sp500CorporateActions).delete()
             session.commit()
 
-        # Prepare data for bulk insertion
-        records_to_insert = []
-        for _, row in df.iterrows():
-            record = Sp500CorporateActions(
-                symbol=row["symbol"],
-                event_type=row["event_type"],
-                ex_date=row["ex_date"] if pd.notna(row["ex_date"]) else None,
-                record_date=(
-                    row["record_date"] if pd.notna(row["record_date"]) else None
-                ),
-                pay_date=row["pay_date"] if pd.notna(row["pay_date"]) else None,
-                ratio=(
-                    row["ratio"]
-                    if pd.notna(row["ratio"]) and row["ratio"] != ""
-                    else None
-                ),
-                cash_amount=(
-                    row["cash_amount"] if pd.notna(row["cash_amount"]) else None
-                ),
-            )
-            records_to_insert.append(record)
+        # Prepare data for bulk insertion: null handling is done once over the
+        # whole frame (NaN/NaT and empty ratios become None) instead of per row
+        columns = [
+            "symbol",
+            "event_type",
+            "ex_date",
+            "record_date",
+            "pay_date",
+            "ratio",
+            "cash_amount",
+        ]
+        df_insert = df[columns].astype(object)
+        df_insert = df_insert.where(df_insert.notna(), None)
+        df_insert["ratio"] = df_insert["ratio"].where(df_insert["ratio"] != "", None)
+        records_to_insert = df_insert.to_dict(orient="records")
 
         # Bulk insert
         print(f"Inserting {len(records_to_insert)} records...")
-        session.bulk_save_objects(records_to_insert)
+        session.bulk_insert_mappings(Sp500CorporateActions, records_to_insert)
         session.commit()
 
         # Get final count
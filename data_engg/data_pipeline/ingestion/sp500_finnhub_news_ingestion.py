@@ -7,15 +7,18 @@ It uses the sp500_finnhub_news table created by create_tables.py
 
 Usage:
     python sp500_finnhub_news_ingestion.py [--input-file PATH] [--batch-size SIZE] [--test-mode]
+        [--max-workers N] [--commit-every N]
 """
 
 import os
 import sys
 import pandas as pd
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterable
 import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from itertools import islice
 
 # Add parent directories to path for imports - system independent
 current_dir = Path(__file__).parent.absolute()
@@ -24,8 +27,8 @@ sys.path.insert(0, str(data_engg_root))
 
 try:
     from database.config.config import Config
-    from database.db_connection import engine, Session
-    from database.create_tables import (
+    from database.db_connection import engine
+    from database.models.sp500_raw import (
         Sp500FinnhubNews,
     )  # Import the model for the target table
 
@@ -37,119 +40,186 @@ except ImportError as e:
     sys.exit(1)
 
 
+# CSV columns loaded into sp500_finnhub_news; anything else in the file is skipped
+EXPECTED_COLUMNS = [
+    "symbol",
+    "id",
+    "datetime",
+    "headline",
+    "summary",
+    "source",
+    "url",
+    "image",
+    "related",
+    "category",
+]
+
+# Parse-time conversions so cleaning doesn't re-scan these columns
+CSV_DTYPES = {"id": "string"}
+CSV_PARSE_DATES = ["datetime"]
+
+
 def validate_csv_structure(df: pd.DataFrame) -> bool:
     """Validate that the CSV has the expected structure for sp500_finnhub_news"""
-    expected_columns = [
-        "symbol",
-        "id",
-        "datetime",
-        "headline",
-        "summary",
-        "source",
-        "url",
-        "image",
-        "related",
-        "category",
-    ]
-
     # Check if all expected columns exist
-    missing_columns = [col for col in expected_columns if col not in df.columns]
+    missing_columns = set(EXPECTED_COLUMNS).difference(df.columns)
     if missing_columns:
-        print(f"✗ Missing columns: {missing_columns}")
+        print(f"✗ Missing columns: {sorted(missing_columns)}")
         return False
 
     return True
 
 
 def clean_and_prepare_data(df: pd.DataFrame) -> pd.DataFrame:
-    """Clean and prepare data for database insertion"""
-    print("Cleaning and preparing data...")
+    """Clean and prepare one chunk of data for database insertion"""
 
-    # Create a copy to avoid modifying the original
-    df_clean = df.copy()
+    # The reader already parsed datetimes; a chunk only arrives as object when
+    # it held unparseable values, so coerce those to NaT in place
+    if not pd.api.types.is_datetime64_any_dtype(df["datetime"]):
+        df["datetime"] = pd.to_datetime(df["datetime"], errors="coerce")
 
-    # Convert datetime column
-    df_clean["datetime"] = pd.to_datetime(df_clean["datetime"], errors="coerce")
+    # Remove rows with invalid datetime before any filling, so NaT is still
+    # visible; the validity mask is computed once and reused for the slice
+    valid_datetime = df["datetime"].notna()
+    invalid_count = len(df) - int(valid_datetime.sum())
+    if invalid_count:
+        df = df.loc[valid_datetime]
+        print(f"Removed {invalid_count} rows with invalid datetime")
 
-    # Handle missing values
-    df_clean = df_clean.fillna("")
+    # Handle missing values in the text columns only
+    text_columns = df.columns.drop("datetime")
+    df_clean = df.fillna({col: "" for col in text_columns})
 
-    # Convert news_id to string
-    df_clean["news_id"] = df_clean["id"].astype(str)
+    # 'id' is read as a string column; rename it so it doesn't conflict with
+    # the auto-increment primary key
+    df_clean = df_clean.rename(columns={"id": "news_id"})
 
-    # Remove the original 'id' column to avoid conflicts with auto-increment primary key
-    df_clean = df_clean.drop(columns=["id"])
+    return df_clean
 
-    # Remove rows with invalid datetime
-    initial_count = len(df_clean)
-    df_clean = df_clean.dropna(subset=["datetime"])
-    final_count = len(df_clean)
 
-    if initial_count != final_count:
-        print(f"Removed {initial_count - final_count} rows with invalid datetime")
+def build_insert_sql(columns: List[str]) -> str:
+    """
+    Build a positional (%s) INSERT for the given column order, so batches
+    can be bound as plain row tuples instead of one dict per row.
+    """
+    placeholders = ", ".join(["%s"] * len(columns))
+    return (
+        f"INSERT INTO {Sp500FinnhubNews.__tablename__} ({', '.join(columns)}) "
+        f"VALUES ({placeholders})"
+    )
 
-    print(f"✓ Data cleaning completed. Records: {len(df_clean):,}")
-    return df_clean
+
+def insert_batches(batch_group: List[pd.DataFrame]) -> int:
+    """
+    Insert a group of cleaned batches on one connection in one transaction.
+    Each call checks out its own pooled connection, so groups can be
+    inserted concurrently from worker threads; the group commits once.
+    """
+    records_inserted = 0
+
+    # Every batch shares the cleaned column order, so build the statement once
+    columns = batch_group[0].columns.tolist()
+    insert_sql = build_insert_sql(columns)
+
+    # engine.begin() commits on exit and rolls back on error - no ORM Session
+    with engine.begin() as conn:
+        for batch_df in batch_group:
+            # Row tuples straight from the column arrays - no per-row dicts
+            column_arrays = [batch_df[col].to_numpy(dtype=object) for col in columns]
+            rows = list(zip(*column_arrays))
+
+            # Driver-level executemany; PyMySQL sends it as multi-row INSERTs
+            conn.exec_driver_sql(insert_sql, rows)
+            records_inserted += len(rows)
+
+    return records_inserted
 
 
 def bulk_insert_data(
-    df: pd.DataFrame, batch_size: int = 10000, test_mode: bool = False
+    batches: Iterable[pd.DataFrame],
+    test_mode: bool = False,
+    max_workers: int = 4,
+    commit_every: int = 10,
 ) -> dict:
-    """Perform bulk insert of data to database"""
-    total_records = len(df)
-    total_batches = (total_records + batch_size - 1) // batch_size
+    """
+    Perform bulk insert of cleaned data batches to database.
+    Batches are grouped commit_every at a time; each group is loaded in a
+    single transaction by one of max_workers worker threads. A failing group
+    is rolled back as a whole. At most 2 * max_workers groups are in flight,
+    so a chunked CSV reader can feed this without loading the whole file.
+    """
+    total_records = 0
     successful_records = 0
     failed_records = 0
-
-    print(
-        f"Starting bulk insert: {total_records:,} records in {total_batches} batches..."
-    )
-
-    try:
-        with Session() as session:
-            for batch_num in range(total_batches):
-                start_idx = batch_num * batch_size
-                end_idx = min(start_idx + batch_size, total_records)
-                batch_df = df.iloc[start_idx:end_idx]
-
-                # Show progress every 10 batches or for the last batch
-                if (batch_num + 1) % 10 == 0 or (batch_num + 1) == total_batches:
-                    print(
-                        f"Progress: {batch_num + 1}/{total_batches} batches ({(batch_num + 1)/total_batches*100:.1f}%)"
-                    )
-
-                try:
-                    # Convert DataFrame to list of dictionaries
-                    records = batch_df.to_dict("records")
-
-                    # Insert records using bulk_insert_mappings for better performance
-                    session.bulk_insert_mappings(Sp500FinnhubNews, records)
-                    session.commit()
-
-                    batch_success = len(records)
-                    successful_records += batch_success
-
-                    if test_mode and batch_num >= 2:  # Limit to 3 batches in test mode
-                        print("Test mode: Stopping after 3 batches")
-                        break
-
-                except Exception as e:
-                    print(f"✗ Error in batch {batch_num + 1}: {e}")
-                    session.rollback()
-                    failed_records += len(batch_df)
-                    continue
-
-    except Exception as e:
-        print(f"✗ Database connection error: {e}")
-        return {"success": False, "error": str(e)}
+    batches_read = 0
+
+    print(f"Starting bulk insert with {max_workers} workers...")
+    print(f"Committing every {commit_every} batches")
+
+    def collect(done) -> None:
+        nonlocal successful_records, failed_records
+        for future in done:
+            first_batch, last_batch, group_size = pending.pop(future)
+            if future.cancelled():
+                failed_records += group_size
+                continue
+            try:
+                successful_records += future.result()
+            except Exception as e:
+                print(f"✗ Error in batches {first_batch}-{last_batch}: {e}")
+                failed_records += group_size
+
+    pending = {}
+    batch_iter = iter(batches)
+    read_error = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # Reading/cleaning errors surface here, not in the insert workers
+            try:
+                batch_group = list(islice(batch_iter, commit_every))
+            except Exception as e:
+                print(f"✗ Error reading batches after batch {batches_read}: {e}")
+                read_error = e
+                break
+
+            if not batch_group:
+                break
+
+            group_size = sum(len(batch_df) for batch_df in batch_group)
+            pending[executor.submit(insert_batches, batch_group)] = (
+                batches_read + 1,
+                batches_read + len(batch_group),
+                group_size,
+            )
+            batches_read += len(batch_group)
+            total_records += group_size
+
+            print(f"Progress: {batches_read} batches, {total_records:,} records read")
+
+            # Bound the number of groups held in memory
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+        # On a read error, groups that haven't started are cancelled; the ones
+        # already running finish, and are counted so the caller knows what
+        # was committed
+        if read_error is not None:
+            for future in pending:
+                future.cancel()
+
+        collect(wait(pending).done)
 
     result = {
-        "success": True,
+        "success": read_error is None,
         "total_records": total_records,
         "successful_records": successful_records,
         "failed_records": failed_records,
         "test_mode": test_mode,
     }
+    if read_error is not None:
+        result["error"] = str(read_error)
 
     print("\n" + "=" * 50)
     print("BULK INSERT SUMMARY")
@@ -157,7 +227,8 @@ def bulk_insert_data(
     print(f"Total records processed: {total_records:,}")
     print(f"Successfully inserted: {successful_records:,}")
     print(f"Failed records: {failed_records:,}")
-    print(f"Success rate: {(successful_records/total_records)*100:.2f}%")
+    if total_records:
+        print(f"Success rate: {(successful_records/total_records)*100:.2f}%")
 
     return result
 
@@ -184,6 +255,18 @@ def main():
         action="store_true",
         help="Run in test mode (limited records)",
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Number of batch groups loaded concurrently (default: 4)",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=10,
+        help="Number of batches committed per transaction (default: 10)",
+    )
 
     args = parser.parse_args()
 
@@ -192,6 +275,8 @@ def main():
     print(f"Input file: {args.input_file}")
     print(f"Batch size: {args.batch_size:,}")
     print(f"Test mode: {args.test_mode}")
+    print(f"Max workers: {args.max_workers}")
+    print(f"Commit every: {args.commit_every} batches")
     print()
 
     # Check if input file exists
@@ -200,26 +285,41 @@ def main():
         sys.exit(1)
 
     try:
-        # Read CSV file
-        print("Reading CSV file...")
-        df = pd.read_csv(args.input_file)
-        print(f"✓ CSV file read successfully. Records: {len(df):,}")
-
-        # Validate CSV structure
-        if not validate_csv_structure(df):
+        # Validate CSV structure from the header row only
+        header = pd.read_csv(args.input_file, nrows=0)
+        if not validate_csv_structure(header):
             print("✗ CSV structure validation failed")
             sys.exit(1)
 
-        # Clean and prepare data
-        df_clean = clean_and_prepare_data(df)
+        # Stream the CSV in batch-sized chunks, cleaning each one just before insert.
+        # Test mode caps the read itself at 3 batches, so the insert loop never checks it
+        print("Reading CSV file in chunks...")
+        if args.test_mode:
+            print("Test mode: Reading only the first 3 batches")
+        reader = pd.read_csv(
+            args.input_file,
+            chunksize=args.batch_size,
+            nrows=3 * args.batch_size if args.test_mode else None,
+            usecols=EXPECTED_COLUMNS,
+            dtype=CSV_DTYPES,
+            parse_dates=CSV_PARSE_DATES,
+            date_format="ISO8601",
+        )
+        cleaned_batches = (clean_and_prepare_data(chunk) for chunk in reader)
 
         # Perform bulk insert
-        result = bulk_insert_data(df_clean, args.batch_size, args.test_mode)
+        result = bulk_insert_data(
+            cleaned_batches, args.test_mode, args.max_workers, args.commit_every
+        )
 
         if result["success"]:
             print("\n✓ Data ingestion completed successfully!")
         else:
             print(f"\n✗ Data ingestion failed: {result.get('error', 'Unknown error')}")
+            print(
+                f"{result['successful_records']:,} records were already committed "
+                "before the failure"
+            )
             sys.exit(1)
 
     except Exception as e:
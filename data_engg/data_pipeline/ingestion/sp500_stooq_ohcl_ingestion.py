@@ -18,6 +18,8 @@ import argparse
 from datetime import datetime
 import time
 
+from sqlalchemy import text
+
 # Add parent directories to path for imports
 current_dir = Path(__file__).parent.absolute()
 project_root = current_dir.parent.parent  # Go up to data_engg/
@@ -26,7 +28,7 @@ sys.path.insert(0, str(project_root))
 try:
     from database.db_connection import engine, Session
     from database.config.config import Config
-    from database.create_tables import Sp500StockData
+    from database.models.sp500_raw import Sp500StockData
 
     print("Database modules imported successfully")
 except ImportError as e:
@@ -39,7 +41,7 @@ def validate_csv_structure(df: pd.DataFrame) -> bool:
     """Validate that CSV has the expected structure"""
     expected_columns = ["Ticker", "Date", "Open", "High", "Low", "Close", "Volume"]
 
-    if not all(col in df.columns for col in expected_columns):
+    if not set(expected_columns).issubset(df.columns):
         print(f"Error: CSV missing required columns. Expected: {expected_columns}")
         print(f"Found: {list(df.columns)}")
         return False
@@ -133,13 +135,9 @@ def bulk_insert_data(
                     # Convert DataFrame to list of dictionaries
                     batch_records = batch_df.to_dict("records")
 
-                    # Create model instances
-                    model_instances = []
-                    for record in batch_records:
-                        model_instances.append(Sp500StockData(**record))
-
-                    # Bulk insert using SQLAlchemy
-                    session.bulk_save_objects(model_instances)
+                    # Core executemany insert without building ORM objects;
+                    # PyMySQL rewrites it into multi-row INSERT statements
+                    session.execute(Sp500StockData.__table__.insert(), batch_records)
                     session.commit()
 
                     total_inserted += len(batch_records)
@@ -249,8 +247,8 @@ def main():
 
     try:
         # Test database connection
-        with Session() as session:
-            session.execute("SELECT 1")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         print("✓ Database connection successful")
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
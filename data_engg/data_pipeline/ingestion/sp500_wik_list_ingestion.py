@@ -1,11 +1,16 @@
 import os
+import re
 import sys
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Any
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from sqlalchemy import text
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+
 # Add parent directories to path for imports - system independent
 current_dir = Path(__file__).parent.absolute()
 data_engg_root = current_dir.parent.parent  # Go up to data_engg/
@@ -14,7 +19,7 @@ sys.path.insert(0, str(data_engg_root))
 try:
     from database.config.config import Config
     from database.db_connection import engine, Session
-    from database.create_tables import (
+    from database.models.sp500_raw import (
         Sp500WikiList,
     )  # Import the model for the target table
 
@@ -26,6 +31,22 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Cleaning patterns, compiled once at import
+NON_DIGIT_PATTERN = re.compile(r"[^0-9]")
+YEAR_PATTERN = re.compile(r"(\d{4})")
+
+# UPSERT keyed on (symbol, date_added), built once at import; a rerun
+# refreshes the descriptive columns instead of failing on the primary key
+_wiki_list_insert = mysql_insert(Sp500WikiList.__table__)
+WIKI_LIST_UPSERT = _wiki_list_insert.on_duplicate_key_update(
+    {
+        column.name: _wiki_list_insert.inserted[column.name]
+        for column in Sp500WikiList.__table__.columns
+        if not column.primary_key
+    }
+)
+
+
 def validate_csv_structure(df: pd.DataFrame) -> bool:
     """Validate that the CSV has the expected structure for sp500_wik_list"""
     expected_columns = [
@@ -44,9 +65,9 @@ def validate_csv_structure(df: pd.DataFrame) -> bool:
     print(f"Actual columns: {list(df.columns)}")
 
     # Check if all expected columns exist
-    missing_columns = [col for col in expected_columns if col not in df.columns]
+    missing_columns = set(expected_columns).difference(df.columns)
     if missing_columns:
-        print(f"✗ Missing columns: {missing_columns}")
+        print(f"✗ Missing columns: {sorted(missing_columns)}")
         return False
 
     print("✓ CSV structure validation passed")
@@ -57,9 +78,6 @@ def clean_and_prepare_data(df: pd.DataFrame) -> pd.DataFrame:
     """Clean and prepare the data for insertion"""
     print("Cleaning and preparing data...")
 
-    # Create a copy to work with
-    df_clean = df.copy()
-
     # Rename columns to match database schema
     column_mapping = {
         "Symbol": "symbol",
@@ -72,17 +90,23 @@ def clean_and_prepare_data(df: pd.DataFrame) -> pd.DataFrame:
         "Founded": "founded",
     }
 
-    df_clean = df_clean.rename(columns=column_mapping)
+    # Rename in place - the raw frame is not reused by the caller, so no copy
+    df.rename(columns=column_mapping, inplace=True)
+    df_clean = df
 
     # Convert date_added to datetime
     df_clean["date_added"] = pd.to_datetime(df_clean["date_added"], errors="coerce")
 
     # Clean CIK - remove any non-numeric characters, pad with zeros, and add CIK prefix
-    df_clean["cik"] = df_clean["cik"].astype(str).str.replace(r"[^0-9]", "", regex=True)
-    df_clean["cik"] = "CIK" + df_clean["cik"].str.zfill(10)
+    # (one chained pass, no intermediate column assignment)
+    df_clean["cik"] = "CIK" + df_clean["cik"].astype(str).str.replace(
+        NON_DIGIT_PATTERN, "", regex=True
+    ).str.zfill(10)
 
     # Clean founded year - extract year if it contains additional text
-    df_clean["founded"] = df_clean["founded"].astype(str).str.extract(r"(\d{4})")[0]
+    df_clean["founded"] = (
+        df_clean["founded"].astype(str).str.extract(YEAR_PATTERN, expand=False)
+    )
 
     # Remove rows with missing primary key values
     initial_count = len(df_clean)
@@ -98,8 +122,31 @@ def clean_and_prepare_data(df: pd.DataFrame) -> pd.DataFrame:
     return df_clean
 
 
+def insert_batch(batch_records: List[Dict[str, Any]]) -> int:
+    """
+    Upsert one batch of records in its own session
+
+    Each call checks out its own connection from the engine pool, so batches
+    can be inserted concurrently from worker threads.
+
+    Args:
+        batch_records: Record dicts keyed by column name
+
+    Returns:
+        int: Number of records upserted
+    """
+    with Session() as session:
+        # Core executemany upsert - no per-row ORM objects
+        session.execute(WIKI_LIST_UPSERT, batch_records)
+        session.commit()
+    return len(batch_records)
+
+
 def bulk_insert_data(
-    df: pd.DataFrame, batch_size: int = 1000, test_mode: bool = False
+    df: pd.DataFrame,
+    batch_size: int = 1000,
+    test_mode: bool = False,
+    max_workers: int = 4,
 ) -> dict:
     """
     Bulk insert data into the database using UPSERT (INSERT ... ON DUPLICATE KEY UPDATE)
@@ -108,6 +155,8 @@ def bulk_insert_data(
         df: DataFrame with cleaned data
         batch_size: Number of records to process in each batch
         test_mode: If True, only process first batch for testing
+        max_workers: Number of batches inserted concurrently (keep within the
+            engine's connection pool size)
 
     Returns:
         dict: Results summary
@@ -124,56 +173,51 @@ def bulk_insert_data(
     errors = 0
     start_time = datetime.now()
 
-    with Session() as session:
-        try:
-            # Process data in batches
-            for i in range(0, total_records, batch_size):
-                batch_df = df.iloc[i : i + batch_size]
-                batch_num = (i // batch_size) + 1
-
-                print(f"Processing batch {batch_num} ({len(batch_df):,} records)...")
-
-                try:
-                    # Convert DataFrame to list of dictionaries
-                    batch_records = batch_df.to_dict("records")
+    # Pull each column out as an object array once; rows are zipped per batch
+    columns = df.columns.tolist()
+    column_arrays = [df[col].to_numpy(dtype=object) for col in columns]
+
+    # Build record dicts from the column arrays, one list per batch
+    batches = [
+        [
+            dict(zip(columns, row))
+            for row in zip(*(arr[i : i + batch_size] for arr in column_arrays))
+        ]
+        for i in range(0, total_records, batch_size)
+    ]
 
-                    # Create model instances
-                    model_instances = []
-                    for record in batch_records:
-                        model_instances.append(Sp500WikiList(**record))
+    print(f"Dispatching {len(batches):,} batches to {max_workers} workers...")
 
-                    # Bulk insert using SQLAlchemy
-                    session.bulk_save_objects(model_instances)
-                    session.commit()
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(insert_batch, batch) for batch in batches]
 
-                    successful_inserts += len(batch_records)
+            for batch_num, (batch_records, future) in enumerate(
+                zip(batches, futures), start=1
+            ):
+                try:
+                    successful_inserts += future.result()
                     print(f"✓ Batch {batch_num} inserted successfully")
-
                 except Exception as e:
                     print(f"✗ Error in batch {batch_num}: {e}")
-                    session.rollback()
                     errors += len(batch_records)
                     continue
 
                 # Progress update
-                progress = (i + len(batch_df)) / total_records * 100
+                progress = (successful_inserts + errors) / total_records * 100
                 print(
                     f"Progress: {progress:.1f}% - Inserted {successful_inserts:,}/{total_records:,} records"
                 )
 
-                if test_mode:
-                    break
-
-        except Exception as e:
-            print(f"✗ Fatal error during bulk insert: {e}")
-            session.rollback()
-            return {
-                "success": False,
-                "total_records": total_records,
-                "successful_inserts": successful_inserts,
-                "errors": errors,
-                "duration": (datetime.now() - start_time).total_seconds(),
-            }
+    except Exception as e:
+        print(f"✗ Fatal error during bulk insert: {e}")
+        return {
+            "success": False,
+            "total_records": total_records,
+            "successful_inserts": successful_inserts,
+            "errors": errors,
+            "duration": (datetime.now() - start_time).total_seconds(),
+        }
 
     duration = (datetime.now() - start_time).total_seconds()
     rate = successful_inserts / duration if duration > 0 else 0
@@ -210,6 +254,12 @@ def main():
     parser.add_argument(
         "--test-mode", action="store_true", help="Test mode (process only first batch)"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Number of batches inserted concurrently",
+    )
 
     args = parser.parse_args()
 
@@ -218,11 +268,12 @@ def main():
     print(f"Input file: {args.input_file}")
     print(f"Batch size: {args.batch_size:,}")
     print(f"Test mode: {args.test_mode}")
+    print(f"Max workers: {args.max_workers}")
 
     # Test database connection
     try:
-        with Session() as session:
-            session.execute("SELECT 1")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         print("✓ Database connection successful")
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
@@ -251,7 +302,9 @@ def main():
     df_clean = clean_and_prepare_data(df)
 
     # Perform bulk insert
-    result = bulk_insert_data(df_clean, args.batch_size, args.test_mode)
+    result = bulk_insert_data(
+        df_clean, args.batch_size, args.test_mode, args.max_workers
+    )
 
     if result["success"]:
         print("\n✓ Data ingestion completed successfully!")
@@ -3,9 +3,10 @@ Test script for JSON Extractor
 Tests the process_single_file method and converts JSON data to CSV for verification
 """
 
+import csv
 import os
 import sys
-import pandas as pd
+from collections import defaultdict
 from pathlib import Path
 from typing import Dict, List, Any
 
@@ -32,40 +33,64 @@ class JSONToCSVConverter:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-    def convert_facts_to_csv(self, normalized_records: List[tuple], cik: str) -> str:
+    def split_records_by_type(
+        self, normalized_records: List[tuple]
+    ) -> Dict[str, List[Dict[str, Any]]]:
         """
-        Convert normalized facts data to CSV format
+        Partition normalized records by record type in a single pass
 
         Args:
             normalized_records: List of (record_type, record_data) tuples
+
+        Returns:
+            Dictionary mapping record type ("fact"/"dict") to its records
+        """
+        records_by_type = defaultdict(list)
+        for record_type, record_data in normalized_records:
+            records_by_type[record_type].append(record_data)
+        return records_by_type
+
+    @staticmethod
+    def write_records_csv(records: List[Dict[str, Any]], csv_path: Path) -> None:
+        """
+        Stream records straight to CSV without building a DataFrame
+
+        Args:
+            records: Record dicts sharing the same keys
+            csv_path: Destination CSV file
+        """
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(records[0]))
+            writer.writeheader()
+            writer.writerows(records)
+
+    def convert_facts_to_csv(
+        self, records_by_type: Dict[str, List[Dict[str, Any]]], cik: str
+    ) -> str:
+        """
+        Convert normalized facts data to CSV format
+
+        Args:
+            records_by_type: Records partitioned by split_records_by_type
             cik: Company CIK identifier
 
         Returns:
             Path to the created CSV file
         """
-        fact_records = []
-        dict_records = []
-
-        # Separate records by type
-        for record_type, record_data in normalized_records:
-            if record_type == "fact":
-                fact_records.append(record_data)
-            elif record_type == "dict":
-                dict_records.append(record_data)
+        fact_records = records_by_type.get("fact", [])
+        dict_records = records_by_type.get("dict", [])
 
         # Create CSV files for each record type
         csv_files = []
 
         if fact_records:
-            facts_df = pd.DataFrame(fact_records)
             facts_csv_path = self.output_dir / f"facts_{cik}.csv"
-            facts_df.to_csv(facts_csv_path, index=False)
+            self.write_records_csv(fact_records, facts_csv_path)
             csv_files.append(str(facts_csv_path))
 
         if dict_records:
-            dict_df = pd.DataFrame(dict_records)
             dict_csv_path = self.output_dir / f"dictionary_{cik}.csv"
-            dict_df.to_csv(dict_csv_path, index=False)
+            self.write_records_csv(dict_records, dict_csv_path)
             csv_files.append(str(dict_csv_path))
 
         return csv_files
@@ -96,21 +121,20 @@ def test_single_file_processing():
     print(f"Testing with file: {test_file.name}")
 
     try:
-        # Process the JSON file and extract data
-        result = extractor.process_single_file(test_file)
+        # Process the JSON file once, keeping the normalized records for CSV conversion
+        result, normalized_records = extractor.process_single_file_with_records(
+            test_file
+        )
         print(f"Processing result: {result}")
+        cik = result["cik"]
 
-        # Extract and normalize data for CSV conversion
-        cik = extractor.extract_cik_from_filename(test_file)
-        json_data = extractor.load_json_file(test_file)
-        normalized_records = extractor.normalize_facts_data(json_data, cik)
-
-        # Convert normalized data to CSV files
-        csv_files = csv_converter.convert_facts_to_csv(normalized_records, cik)
+        # Split once, then convert normalized data to CSV files
+        records_by_type = csv_converter.split_records_by_type(normalized_records)
+        csv_files = csv_converter.convert_facts_to_csv(records_by_type, cik)
 
         # Count records by type
-        fact_count = sum(1 for r_type, _ in normalized_records if r_type == "fact")
-        dict_count = sum(1 for r_type, _ in normalized_records if r_type == "dict")
+        fact_count = len(records_by_type["fact"])
+        dict_count = len(records_by_type["dict"])
 
         print(f"Successfully processed {test_file.name}")
         print(f"Created CSV files: {csv_files}")
@@ -15,7 +15,7 @@ project_root = current_dir.parent.parent.parent  # Go up to data_engg/
 sys.path.insert(0, str(project_root))
 
 try:
-    from database.config.config import Config
+    from database.config.config import get_config
     from database.db_connection import engine
     from data_pipeline.ingestion.json_extractor_submissions import (
         SECSubmissionsExtractor,
@@ -69,7 +69,7 @@ def test_single_file_processing():
 
     # Configuration
     json_directory = "/Users/ssp/Documents/MS_CS/Projects_git/sp500_agentic_ai/data/submissions_facts"
-    db_config = Config()
+    db_config = get_config()
 
     # Initialize extractor and CSV converter
     extractor = SECSubmissionsExtractor(json_directory, db_config)
@@ -94,7 +94,7 @@ def test_single_file_processing():
         # Extract and normalize data for CSV conversion
         cik = extractor.extract_cik_from_filename(test_file)
         json_data = extractor.load_json_file(test_file)
-        normalized_records = extractor.normalize_submissions_data(json_data, cik)
+        normalized_records = list(extractor.normalize_submissions_data(json_data, cik))
 
         # Convert normalized data to single CSV file
         csv_file = csv_converter.convert_submissions_to_csv(normalized_records, cik)
@@ -148,7 +148,7 @@ def test_data_extraction():
 
     # Configuration
     json_directory = "/Users/ssp/Documents/MS_CS/Projects_git/sp500_agentic_ai/data/submissions_facts"
-    db_config = Config()
+    db_config = get_config()
 
     # Initialize extractor
     extractor = SECSubmissionsExtractor(json_directory, db_config)
@@ -173,7 +173,7 @@ def test_data_extraction():
         print(f"JSON data keys: {list(json_data.keys())}")
 
         # Test normalization
-        normalized_records = extractor.normalize_submissions_data(json_data, cik)
+        normalized_records = list(extractor.normalize_submissions_data(json_data, cik))
 
         print(f"Normalized {len(normalized_records)} records")
 
@@ -209,7 +209,7 @@ def test_both_files():
 
     # Configuration
     json_directory = "/Users/ssp/Documents/MS_CS/Projects_git/sp500_agentic_ai/data/submissions_facts"
-    db_config = Config()
+    db_config = get_config()
 
     # Initialize extractor and CSV converter
     extractor = SECSubmissionsExtractor(json_directory, db_config)
@@ -257,7 +257,9 @@ def test_both_files():
                 print(f"Number of records: {len(json_data.get('filingDate', []))}")
 
             # Test normalization
-            normalized_records = extractor.normalize_submissions_data(json_data, cik)
+            normalized_records = list(
+                extractor.normalize_submissions_data(json_data, cik)
+            )
             print(f"Normalized {len(normalized_records)} records")
 
             # Count by type
@@ -4,11 +4,16 @@ JSON Submissions to Database Import Script
 Uses JSON extractor methods to process submissions JSON files and push data directly into database
 """
 
+import fnmatch
+import mmap
 import os
+import re
 import sys
 import pandas as pd
+from sqlalchemy import text
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Iterator, Tuple
 
 # Add parent directories to path for imports - system independent
 current_dir = Path(__file__).parent.absolute()
@@ -16,12 +21,11 @@ project_root = current_dir.parent.parent.parent  # Go up to data_engg/
 sys.path.insert(0, str(project_root))
 
 try:
-    from database.config.config import Config
+    from database.config.config import get_config
     from database.db_connection import engine, Session
     from data_pipeline.ingestion.json_extractor_submissions import (
         SECSubmissionsExtractor,
     )
-    from database.models.sec_submissions_raw import BronzeSecSubmissions
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print(f"Project root: {project_root}")
@@ -29,29 +33,86 @@ except ImportError as e:
     sys.exit(1)
 
 
+# simdjson is optional; one parser is reused across files so its internal
+# buffers are recycled instead of reallocated per document
+try:
+    import simdjson
+
+    _JSON_PARSER = simdjson.Parser()
+except ImportError:
+    _JSON_PARSER = None
+
+# Without simdjson, orjson (SIMD-accelerated, parses bytes without decoding
+# them to str first) is the next choice, then stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Submissions filenames: CIK0000001800.json or CIK0000001800-submissions-001.json
+CIK_FILENAME_PATTERN = re.compile(r"CIK\d+(?:-submissions-\d+)?\.json")
+
+# Files upserted per transaction in main()
+COMMIT_EVERY_FILES = 5
+
+# Record count and sample values for display_database_counts in one round trip:
+# - n: row estimate from the server's table statistics (MySQL/TiDB equivalent
+#   of pg reltuples), falling back to an exact COUNT(*) when statistics are
+#   missing or not yet collected, which is cheap on an empty table
+# - ciks: first distinct CIKs via a loose index scan; each step is one probe of
+#   the primary key (cik is its leading column) for the next larger value
+# - forms: distinct non-empty forms among the first :form_scan_rows rows, a
+#   bounded sample regardless of table size
+SUMMARY_SQL = text(
+    """
+    WITH RECURSIVE t (cik, n) AS (
+        SELECT MIN(cik), 1 FROM bronze_sec_submissions
+        UNION ALL
+        SELECT (SELECT MIN(cik) FROM bronze_sec_submissions WHERE cik > t.cik), n + 1
+        FROM t
+        WHERE t.cik IS NOT NULL AND n < :cik_limit
+    )
+    SELECT
+        COALESCE(
+            NULLIF(
+                (SELECT TABLE_ROWS FROM information_schema.TABLES
+                 WHERE TABLE_SCHEMA = DATABASE()
+                   AND TABLE_NAME = 'bronze_sec_submissions'),
+                0
+            ),
+            (SELECT COUNT(*) FROM bronze_sec_submissions)
+        ) AS n,
+        (SELECT GROUP_CONCAT(cik ORDER BY cik SEPARATOR '|')
+         FROM t WHERE cik IS NOT NULL) AS ciks,
+        (SELECT GROUP_CONCAT(DISTINCT form SEPARATOR '|')
+         FROM (SELECT form FROM bronze_sec_submissions LIMIT :form_scan_rows) s
+         WHERE form <> '') AS forms
+    """
+)
+
+
 def display_database_counts():
     """Display current record counts in database tables"""
     try:
         with Session() as session:
-            # Count records in bronze_sec_submissions table
-            submissions_count = session.query(BronzeSecSubmissions).count()
+            # Estimated count and sample values of bronze_sec_submissions
+            summary = session.execute(
+                SUMMARY_SQL, {"cik_limit": 5, "form_scan_rows": 200}
+            ).one()
+            submissions_count = int(summary.n)
 
             print("\n--- Database Record Counts ---")
-            print(f"BronzeSecSubmissions (submissions): {submissions_count:,} records")
+            print(
+                f"BronzeSecSubmissions (submissions): ~{submissions_count:,} records (estimated)"
+            )
 
             # Show sample CIK values if any records exist
             if submissions_count > 0:
-                sample_ciks = (
-                    session.query(BronzeSecSubmissions.cik).distinct().limit(5).all()
-                )
-                cik_list = [cik[0] for cik in sample_ciks]
+                cik_list = summary.ciks.split("|") if summary.ciks else []
                 print(f"Sample CIK values: {cik_list}")
 
                 # Show sample forms
-                sample_forms = (
-                    session.query(BronzeSecSubmissions.form).distinct().limit(10).all()
-                )
-                form_list = [form[0] for form in sample_forms if form[0]]
+                form_list = summary.forms.split("|")[:10] if summary.forms else []
                 print(f"Sample forms: {form_list}")
 
             return submissions_count
@@ -75,7 +136,7 @@ def process_submissions_json_file_to_database(json_file_path: str):
         return False
 
     # Initialize extractor
-    extractor = SECSubmissionsExtractor(json_directory="", db_config=Config())
+    extractor = SECSubmissionsExtractor(json_directory="", db_config=get_config())
 
     print(f"Processing submissions JSON file: {json_file.name}")
 
@@ -99,11 +160,53 @@ def process_submissions_json_file_to_database(json_file_path: str):
         return False
 
 
+def iter_json_files(json_dir: Path, file_pattern: str = "*.json") -> Iterator[str]:
+    """
+    Lazily yield paths of files matching the pattern, straight from os.scandir
+    (no Path objects and no full directory listing held in memory)
+
+    Args:
+        json_dir: Directory containing JSON files
+        file_pattern: Pattern to match JSON files (default: "*.json")
+    """
+    with os.scandir(json_dir) as entries:
+        for entry in entries:
+            if entry.is_file() and fnmatch.fnmatch(entry.name, file_pattern):
+                yield entry.path
+
+
+def normalize_submissions_file(json_file_path: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Load and normalize one submissions JSON file without touching the database.
+    Defined at module level so it can run in a worker process.
+
+    Args:
+        json_file_path: Path to the submissions JSON file to normalize
+
+    Returns:
+        Tuple of (CIK, filing records)
+    """
+    json_file = Path(json_file_path)
+
+    # Static parsing helpers only: no extractor, engine or session is built
+    # in the worker
+    cik = SECSubmissionsExtractor.extract_cik_from_filename(json_file)
+    json_data = SECSubmissionsExtractor.load_json_file(json_file)
+    records = SECSubmissionsExtractor.normalize_submissions_data(json_data, cik)
+    filing_records = [
+        record_data for record_type, record_data in records if record_type == "filing"
+    ]
+    return cik, filing_records
+
+
 def process_multiple_submissions_json_files(
     json_directory: str, file_pattern: str = "*.json"
 ):
     """
-    Process multiple submissions JSON files in a directory
+    Process multiple submissions JSON files in a directory.
+    The directory is streamed with os.scandir and files are parsed and
+    normalized in parallel worker processes; the database writes stay in this
+    process on a single session.
 
     Args:
         json_directory: Directory containing JSON files
@@ -115,30 +218,54 @@ def process_multiple_submissions_json_files(
         print(f"Directory not found: {json_directory}")
         return
 
-    # Find all JSON files matching the pattern
-    json_files = list(json_dir.glob(file_pattern))
-
-    if not json_files:
-        print(f"No JSON files found in {json_directory}")
-        return
-
-    print(f"Found {len(json_files)} JSON files to process")
-
     # Process each file
     successful = 0
     failed = 0
-
-    for json_file in json_files:
-        print(f"\n--- Processing {json_file.name} ---")
-        if process_submissions_json_file_to_database(str(json_file)):
-            successful += 1
-        else:
-            failed += 1
+    total_files = 0
+
+    extractor = SECSubmissionsExtractor(json_directory="", db_config=get_config())
+    max_workers = os.cpu_count()
+    pending = {}
+
+    def collect(done, session) -> None:
+        nonlocal successful, failed
+        for future in done:
+            filename = os.path.basename(pending.pop(future))
+            print(f"\n--- Processing {filename} ---")
+            try:
+                cik, filing_records = future.result()
+                extractor.upsert_filings(session, filing_records)
+                session.commit()
+                print(f"CIK: {cik}")
+                print(f"Submission records: {len(filing_records)}")
+                successful += 1
+            except Exception as e:
+                session.rollback()
+                print(f"Error processing {filename}: {e}")
+                failed += 1
+
+    # Files are submitted while the directory is still being walked; at most
+    # 2 * max_workers are in flight, so memory stays flat for any file count
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    with executor, Session() as session:
+        for json_file in iter_json_files(json_dir, file_pattern):
+            total_files += 1
+            pending[executor.submit(normalize_submissions_file, json_file)] = json_file
+
+            if len(pending) >= 2 * max_workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done, session)
+
+        collect(wait(pending).done, session)
+
+    if not total_files:
+        print(f"No JSON files found in {json_directory}")
+        return
 
     print(f"\n--- Processing Complete ---")
     print(f"Successful: {successful}")
     print(f"Failed: {failed}")
-    print(f"Total: {len(json_files)}")
+    print(f"Total: {total_files}")
 
 
 def process_specific_submissions_cik(cik_number: str):
@@ -164,20 +291,31 @@ def test_extractor_without_database():
     json_file_path = "/Users/ssp/Documents/MS_CS/Projects_git/sp500_agentic_ai/data/submissions_facts/CIK0000001800.json"
 
     # Initialize extractor
-    extractor = SECSubmissionsExtractor(json_directory="", db_config=Config())
+    extractor = SECSubmissionsExtractor(json_directory="", db_config=get_config())
 
     try:
-        # Load and normalize the JSON data
-        import json
-
-        with open(json_file_path, "r") as f:
-            json_data = json.load(f)
+        # Load and normalize the JSON data; the file is memory-mapped so the
+        # parser reads straight from the page cache without a bytes copy
+        with open(json_file_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            if _JSON_PARSER is not None:
+                # recursive=True materializes plain dicts/lists, which the
+                # normalizer indexes throughout
+                with memoryview(mm) as view:
+                    json_data = _JSON_PARSER.parse(view, recursive=True)
+            elif _json.__name__ == "orjson":
+                with memoryview(mm) as view:
+                    json_data = _json.loads(view)
+            else:
+                # stdlib json needs bytes
+                json_data = _json.loads(mm[:])
 
         # Extract CIK from filename
         cik = "0000001800"
 
         # Normalize the data
-        normalized_records = extractor.normalize_submissions_data(json_data, cik)
+        normalized_records = list(extractor.normalize_submissions_data(json_data, cik))
 
         print(f"Normalized {len(normalized_records)} records")
         return True
@@ -190,38 +328,32 @@ def test_extractor_without_database():
         return False
 
 
-def process_json_file(file_path):
-    """Process a specific JSON file"""
-    try:
-        # Initialize extractor with required parameters
-        json_directory = "../../../../data/submissions_facts/"
-        extractor = SECSubmissionsExtractor(
-            json_directory=json_directory, db_config=Config()
-        )
-
-        # Extract CIK from filename
-        filename = os.path.basename(file_path)
-        if filename.startswith("CIK") and filename.endswith(".json"):
-            # Extract CIK from filename like CIK0000001800.json or CIK0000001800-submissions-001.json
-            cik_part = filename.replace("CIK", "").replace(".json", "")
-            if "-submissions-" in cik_part:
-                cik = cik_part.split("-submissions-")[0]
-            else:
-                cik = cik_part
-        else:
-            print(f"Invalid filename format: {filename}")
-            return False
-
-        print(f"Processing submissions CIK {cik}")
-        from pathlib import Path
-
-        result = extractor.process_single_file(Path(file_path))
-        return result.get("total_records", 0) > 0
+def process_json_file(extractor, session, file_path, parsed):
+    """
+    Process a specific JSON file with a shared extractor and session.
+    The file is loaded and normalized ahead of time in a worker process;
+    parsed is its normalize_submissions_file future. Filings are upserted on
+    the caller's session; the caller commits, and database errors propagate
+    so the caller can roll back (file load or parse errors just return False).
+    """
+    # Validate the filename in one match
+    json_file = Path(file_path)
+    if not CIK_FILENAME_PATTERN.fullmatch(json_file.name):
+        parsed.cancel()
+        print(f"Invalid filename format: {json_file.name}")
+        return False
 
+    try:
+        cik, filing_records = parsed.result()
     except Exception as e:
+        # A bad file doesn't touch the shared transaction
         print(f"Error processing {file_path}: {e}")
         return False
 
+    print(f"Processing submissions CIK {cik}")
+    extractor.upsert_filings(session, filing_records)
+    return len(filing_records) > 0
+
 
 def main():
     """Main function - process 10 specific JSON files and show database counts"""
@@ -254,20 +386,56 @@ def main():
     successful_files = 0
     total_records_processed = 0
 
-    for i, json_file_path in enumerate(json_files_to_process, 1):
-        filename = os.path.basename(json_file_path)
-        print(f"\n[{i}/{len(json_files_to_process)}] Processing {filename}...")
+    # One extractor and one session for the whole run; files share a
+    # transaction that is committed every COMMIT_EVERY_FILES successful files
+    extractor = SECSubmissionsExtractor(
+        json_directory="../../../../data/submissions_facts/", db_config=get_config()
+    )
+    pending_files = 0
+
+    # Every file is submitted for parsing up front, so while one file's
+    # filings are being upserted the following files are already loading and
+    # normalizing in worker processes; parse time overlaps database round trips
+    max_workers = min(len(json_files_to_process), os.cpu_count() or 1)
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    with executor, Session() as session:
+        parsed_files = [
+            executor.submit(normalize_submissions_file, json_file_path)
+            for json_file_path in json_files_to_process
+        ]
+
+        for i, (json_file_path, parsed) in enumerate(
+            zip(json_files_to_process, parsed_files), 1
+        ):
+            filename = os.path.basename(json_file_path)
+            print(f"\n[{i}/{len(json_files_to_process)}] Processing {filename}...")
+
+            try:
+                success = process_json_file(extractor, session, json_file_path, parsed)
+                if success:
+                    successful_files += 1
+                    pending_files += 1
+                    print(f"✓ Successfully processed {filename}")
+                else:
+                    print(f"✗ Failed to process {filename}")
+
+                if pending_files >= COMMIT_EVERY_FILES:
+                    session.commit()
+                    pending_files = 0
+            except Exception as e:
+                # The open transaction is lost, including earlier uncommitted files
+                session.rollback()
+                successful_files -= pending_files
+                pending_files = 0
+                print(f"✗ Error processing {filename}: {e}")
+                continue
 
         try:
-            success = process_json_file(json_file_path)
-            if success:
-                successful_files += 1
-                print(f"✓ Successfully processed {filename}")
-            else:
-                print(f"✗ Failed to process {filename}")
+            session.commit()
         except Exception as e:
-            print(f"✗ Error processing {filename}: {e}")
-            continue
+            session.rollback()
+            successful_files -= pending_files
+            print(f"✗ Error committing final files: {e}")
 
     # Show final database counts
     print("\n--- Final Database Counts ---")
@@ -7,7 +7,6 @@ Imports CSV data from test_output directory into database tables using SQLAlchem
 import pandas as pd
 import os
 import sys
-from datetime import datetime
 from pathlib import Path
 
 # Add the database directory to the path - system independent
@@ -17,7 +16,8 @@ database_dir = project_root / "database"
 sys.path.insert(0, str(database_dir))
 
 try:
-    from db_connection import Session
+    from db_connection import engine
+    from sqlalchemy.dialects.mysql import insert as mysql_insert
     from models.sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
 except ImportError as e:
     print(f"Error importing database modules: {e}")
@@ -28,8 +28,25 @@ except ImportError as e:
     sys.exit(1)
 
 
+def insert_skip_duplicates(table, conn, keys, data_iter):
+    """
+    pandas to_sql insertion method: one multi-row INSERT per chunk whose
+    ON DUPLICATE KEY UPDATE is a no-op, so rows that hit the (taxonomy, tag)
+    unique key are skipped while other data errors (over-long or NULL
+    values) still fail the insert, unlike INSERT IGNORE.
+
+    Returns the chunk's rowcount for to_sql to sum. The pymysql dialect
+    connects with CLIENT_FOUND_ROWS, so skipped rows count as matched and
+    the total is the number of rows processed, not only the new ones.
+    """
+    records = [dict(zip(keys, row)) for row in data_iter]
+    stmt = mysql_insert(table.table).values(records)
+    result = conn.execute(stmt.on_duplicate_key_update(tag=stmt.inserted.tag))
+    return result.rowcount
+
+
 def import_csv_data():
-    """Import CSV data using SQLAlchemy sessions"""
+    """Import CSV data using multi-row INSERTs through the SQLAlchemy engine"""
 
     # Path to CSV files
     csv_dir = os.path.join(os.path.dirname(__file__), "..", "test_output")
@@ -43,68 +60,27 @@ def import_csv_data():
         print(f"Importing dictionary data from: {dictionary_file}")
         df_dict = pd.read_csv(dictionary_file)
 
-        with Session() as session:
-            try:
-                # Get existing records to avoid duplicates
-                existing_records = session.query(BronzeSecFactsDict).all()
-                existing_keys = {(r.taxonomy, r.tag) for r in existing_records}
-
-                # Prepare new records for insertion
-                records_to_insert = []
-                skipped_rows = []
-
-                for index, row in df_dict.iterrows():
-                    taxonomy = row["taxonomy"]
-                    tag = row["tag"]
-
-                    # Check if record already exists
-                    if (taxonomy, tag) not in existing_keys:
-                        # Create dictionary record object
-                        dict_record = BronzeSecFactsDict(
-                            taxonomy=taxonomy,
-                            tag=tag,
-                            label=row["label"] if pd.notna(row["label"]) else None,
-                            description=(
-                                row["description"]
-                                if pd.notna(row["description"])
-                                else None
-                            ),
-                        )
-                        records_to_insert.append(dict_record)
-                    else:
-                        # Record already exists, add to skipped list
-                        skipped_rows.append(
-                            {
-                                "row": index + 1,  # CSV row number (1-indexed)
-                                "taxonomy": taxonomy,
-                                "tag": tag,
-                            }
-                        )
-
-                # Insert new records into database
-                if records_to_insert:
-                    session.add_all(records_to_insert)
-                    session.commit()
-                    print(
-                        f"Successfully imported {len(records_to_insert)} dictionary records"
-                    )
-                else:
-                    print("No new records to import")
-
-                if skipped_rows:
-                    print(f"Skipped {len(skipped_rows)} existing records:")
-                    for skipped in skipped_rows[:10]:  # Show first 10 skipped records
-                        print(
-                            f"   Row {skipped['row']}: {skipped['taxonomy']} - {skipped['tag']}"
-                        )
-                    if len(skipped_rows) > 10:
-                        print(
-                            f"   ... and {len(skipped_rows) - 10} more existing records"
-                        )
-
-            except Exception as e:
-                session.rollback()
-                print(f"Error importing dictionary data: {e}")
+        try:
+            # created_at/updated_at are filled in by the column server defaults
+            df_new = df_dict[["taxonomy", "tag", "label", "description"]]
+
+            # Multi-row INSERTs; the database skips (taxonomy, tag) pairs that
+            # are already stored, so existing keys are never read back
+            processed = df_new.to_sql(
+                BronzeSecFactsDict.__tablename__,
+                engine,
+                if_exists="append",
+                index=False,
+                method=insert_skip_duplicates,
+                chunksize=1000,
+            )
+            print(
+                f"Processed {processed} dictionary records "
+                "(existing taxonomy/tag pairs were skipped)"
+            )
+
+        except Exception as e:
+            print(f"Error importing dictionary data: {e}")
 
     # Skip facts data import - only importing dictionary data
 
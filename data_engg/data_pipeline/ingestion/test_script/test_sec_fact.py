@@ -4,11 +4,13 @@ Simple CSV to Database Import Script
 Imports facts CSV data from test_output directory into database tables using SQLAlchemy sessions.
 """
 
-import pandas as pd
+import csv
 import os
 import sys
-from datetime import datetime
+from datetime import date
+from itertools import islice
 from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
 
 # Add the database directory to the path - system independent
 current_dir = Path(__file__).parent.absolute()
@@ -19,7 +21,6 @@ sys.path.insert(0, str(database_dir))
 try:
     from db_connection import Session
     from models.sec_facts_raw import BronzeSecFacts
-    from sqlalchemy import text
 except ImportError as e:
     print(f"Error importing database modules: {e}")
     print(f"Database directory: {database_dir}")
@@ -29,6 +30,77 @@ except ImportError as e:
     sys.exit(1)
 
 
+# bronze_sec_facts columns loaded from the facts CSV
+FACT_COLUMNS = [
+    "cik",
+    "taxonomy",
+    "tag",
+    "unit",
+    "val",
+    "fy",
+    "fp",
+    "start_date",
+    "end_date",
+    "frame",
+    "form",
+    "filed",
+    "accn",
+]
+DATE_COLUMNS = ["start_date", "end_date", "filed"]
+
+# Records inserted (and committed) per batch
+BATCH_SIZE = 5000
+
+
+def parse_date(value: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD[ HH:MM:SS] CSV field to a date; unparseable values become None"""
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        return None
+
+
+def parse_int(value: str) -> Optional[int]:
+    """Parse an integer CSV field that may have been written as a float (e.g. 2020.0)"""
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def iter_fact_records(facts_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the facts CSV as insert-ready records, one row at a time.
+    Empty fields become None; dates and fy are converted inline, and val is
+    passed through as text so the database parses it into its DECIMAL column
+    without a float round trip.
+
+    Args:
+        facts_file: Path to the facts CSV
+
+    Yields:
+        Record dictionaries keyed by FACT_COLUMNS
+    """
+    with open(facts_file, newline="") as f:
+        for row in csv.DictReader(f):
+            record = {col: row[col] or None for col in FACT_COLUMNS}
+            for col in DATE_COLUMNS:
+                if record[col] is not None:
+                    record[col] = parse_date(record[col])
+            if record["fy"] is not None:
+                record["fy"] = parse_int(record["fy"])
+            yield record
+
+
+def iter_batches(records: Iterator[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+    """Group streamed records into lists of BATCH_SIZE"""
+    while True:
+        batch = list(islice(records, BATCH_SIZE))
+        if not batch:
+            return
+        yield batch
+
+
 def import_csv_data():
     """Import CSV data using SQLAlchemy sessions"""
 
@@ -41,75 +113,24 @@ def import_csv_data():
     # Import facts data
     if os.path.exists(facts_file):
         print(f"Importing facts data from: {facts_file}")
-        df_facts = pd.read_csv(facts_file)
 
-        print(f"Total records in CSV: {len(df_facts)}")
+        # Core executemany insert; PyMySQL rewrites it into multi-row
+        # INSERT ... VALUES (...), (...) statements
+        insert_stmt = BronzeSecFacts.__table__.insert()
 
         with Session() as session:
             try:
-                print(f"Loaded {len(df_facts)} rows from CSV")
-
-                # Convert CSV rows to database records
-                data_to_insert = []
-                for index, row in df_facts.iterrows():
-                    # Convert date strings to datetime objects
-                    start_date = (
-                        pd.to_datetime(row["start_date"]).to_pydatetime()
-                        if pd.notna(row["start_date"])
-                        else None
-                    )
-                    end_date = (
-                        pd.to_datetime(row["end_date"]).to_pydatetime()
-                        if pd.notna(row["end_date"])
-                        else None
-                    )
-                    filed_date = (
-                        pd.to_datetime(row["filed"]).to_pydatetime()
-                        if pd.notna(row["filed"])
-                        else None
-                    )
-
-                    data_to_insert.append(
-                        {
-                            "cik": row["cik"],
-                            "taxonomy": row["taxonomy"],
-                            "tag": row["tag"],
-                            "unit": row["unit"],
-                            "val": row["val"],
-                            "fy": row["fy"] if pd.notna(row["fy"]) else None,
-                            "fp": row["fp"] if pd.notna(row["fp"]) else None,
-                            "start_date": start_date,
-                            "end_date": end_date,
-                            "frame": row["frame"] if pd.notna(row["frame"]) else None,
-                            "form": row["form"] if pd.notna(row["form"]) else None,
-                            "filed": filed_date,
-                            "accn": row["accn"],
-                        }
-                    )
-
-                # Create SQL insert statement
-                insert_sql = text(
-                    """
-                    INSERT INTO bronze_sec_facts 
-                    (cik, taxonomy, tag, unit, val, fy, fp, start_date, end_date, frame, form, filed, accn)
-                    VALUES (:cik, :taxonomy, :tag, :unit, :val, :fy, :fp, :start_date, :end_date, :frame, :form, :filed, :accn)
-                """
-                )
-
-                # Insert records in batches of 1000
-                batch_size = 1000
+                # Rows are streamed from the CSV, so only one batch is held in
+                # memory; each batch is committed to amortize commits
                 total_inserted = 0
 
-                for i in range(0, len(data_to_insert), batch_size):
-                    batch = data_to_insert[i : i + batch_size]
-                    result = session.execute(insert_sql, batch)
+                for batch in iter_batches(iter_fact_records(facts_file)):
+                    session.execute(insert_stmt, batch)
                     session.commit()
                     total_inserted += len(batch)
-                    print(
-                        f"Processed {total_inserted}/{len(data_to_insert)} records..."
-                    )
+                    print(f"Processed {total_inserted} records...")
 
-                print(f"Successfully inserted {len(data_to_insert)} facts records")
+                print(f"Successfully inserted {total_inserted} facts records")
 
             except Exception as e:
                 session.rollback()
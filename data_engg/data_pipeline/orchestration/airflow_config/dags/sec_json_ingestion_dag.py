@@ -9,6 +9,7 @@ from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add data_engg directory to Python path for imports
@@ -27,6 +28,13 @@ default_args = {
     "retry_delay": timedelta(minutes=5),
 }
 
+# The scan task hands its file list to the processing task through a manifest
+# file; only the manifest path goes through XCom, so the metadata DB never
+# stores the full list. The manifest lives on local disk, so both tasks must
+# run on the same host (true for the Local/Sequential executors, not for
+# Celery or Kubernetes workers without a shared temp directory)
+MANIFEST_DIR = Path(tempfile.gettempdir())
+
 # Define the DAG
 dag = DAG(
     "sec_json_ingestion",
@@ -117,8 +125,8 @@ def display_database_counts(**context):
         return 0, 0
 
 
-def scan_json_files():
-    """Scan and return list of all JSON files in company_facts directory"""
+def scan_json_files(**context):
+    """Scan all JSON files in company_facts directory into a run manifest"""
     try:
         # Path to the JSON files directory (relative to project root)
         project_root = data_engg_root.parent
@@ -127,42 +135,55 @@ def scan_json_files():
 
         if not json_dir.exists():
             print(f"JSON directory not found: {json_directory}")
-            return []
+            return None
 
-        # Find all JSON files
-        json_files = list(json_dir.glob("*.json"))
+        # Find all JSON files; os.scandir yields path strings directly, without
+        # building a Path object per file
+        with os.scandir(json_dir) as entries:
+            file_paths = [
+                entry.path
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".json")
+            ]
 
-        if not json_files:
+        if not file_paths:
             print(f"No JSON files found in {json_directory}")
-            return []
+            return None
 
-        print(f"Found {len(json_files)} JSON files to process")
-        print(f"First 5 files: {[f.name for f in json_files[:5]]}")
-        print(f"Last 5 files: {[f.name for f in json_files[-5:]]}")
+        print(f"Found {len(file_paths)} JSON files to process")
+        print(f"First 5 files: {[os.path.basename(f) for f in file_paths[:5]]}")
+        print(f"Last 5 files: {[os.path.basename(f) for f in file_paths[-5:]]}")
 
-        # Return file paths as strings for XCom
-        file_paths = [str(f) for f in json_files]
-        return file_paths
+        # Write the file paths to a per-run manifest and return only its path
+        manifest_path = MANIFEST_DIR / f"sec_json_manifest_{context['run_id']}.txt"
+        manifest_path.write_text("\n".join(file_paths))
+        print(f"Wrote file manifest: {manifest_path}")
+        return str(manifest_path)
 
     except Exception as e:
         print(f"Error scanning JSON files: {e}")
         import traceback
 
         traceback.print_exc()
-        return []
+        return None
 
 
 def process_all_json_files(**context):
     """Process all JSON files and track extraction vs insertion metrics"""
+    # Get the manifest path from the previous task via XCom. A missing
+    # manifest fails the task instead of reporting an empty run
+    manifest_path = context["task_instance"].xcom_pull(task_ids="scan_json_files")
+    if not manifest_path:
+        raise ValueError("Scan task returned no file manifest")
+    file_paths = Path(manifest_path).read_text().splitlines()
+
     try:
         from database.config.config import Config
         from data_pipeline.ingestion.json_extractor import SECFactsExtractor
 
-        # Get file paths from the previous task via XCom
-        file_paths = context["task_instance"].xcom_pull(task_ids="scan_json_files")
-
         if not file_paths:
             print("No files to process from scan task")
+            Path(manifest_path).unlink(missing_ok=True)
             return False
 
         print(f"Processing {len(file_paths)} files from scan task")
@@ -251,6 +272,10 @@ def process_all_json_files(**context):
             "total_inserted": total_inserted_records,
         }
 
+        # Each run writes its own manifest; remove it only after a completed
+        # run, so clearing the task after a failure can still read it
+        Path(manifest_path).unlink(missing_ok=True)
+
         return metrics
 
     except Exception as e:
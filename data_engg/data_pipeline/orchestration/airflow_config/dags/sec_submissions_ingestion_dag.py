@@ -10,6 +10,7 @@ from airflow.operators.python import PythonOperator
 from airflow.operators.bash import BashOperator
 import os
 import sys
+import tempfile
 from pathlib import Path
 
 # Add data_engg directory to Python path for imports
@@ -28,6 +29,13 @@ default_args = {
     "retry_delay": timedelta(minutes=5),
 }
 
+# The scan task hands its file list to the processing task through a manifest
+# file; only the manifest path goes through XCom, so the metadata DB never
+# stores the full list. The manifest lives on local disk, so both tasks must
+# run on the same host (true for the Local/Sequential executors, not for
+# Celery or Kubernetes workers without a shared temp directory)
+MANIFEST_DIR = Path(tempfile.gettempdir())
+
 # Define the DAG
 dag = DAG(
     "sec_submissions_ingestion",
@@ -102,8 +110,8 @@ def display_submissions_database_counts(**context):
         return 0
 
 
-def scan_submissions_files():
-    """Scan and return list of all JSON files in submissions_facts directory"""
+def scan_submissions_files(**context):
+    """Scan all JSON files in submissions_facts directory into a run manifest"""
     try:
         # Path to the JSON files directory (relative to project root)
         project_root = data_engg_root.parent
@@ -112,18 +120,24 @@ def scan_submissions_files():
 
         if not json_dir.exists():
             print(f"Submissions JSON directory not found: {json_directory}")
-            return []
+            return None
 
-        # Find all JSON files
-        json_files = list(json_dir.glob("*.json"))
+        # Find all JSON files; os.scandir yields names and path strings directly,
+        # without building a Path object per file
+        with os.scandir(json_dir) as entries:
+            json_files = [
+                (entry.name, entry.path)
+                for entry in entries
+                if entry.is_file() and entry.name.endswith(".json")
+            ]
 
         if not json_files:
             print(f"No JSON files found in {json_directory}")
-            return []
+            return None
 
         # Sort files to process main files first, then submissions-001, then submissions-002
-        def sort_key(file_path):
-            name = file_path.name
+        def sort_key(json_file):
+            name = json_file[0]
             if "-submissions-002" in name:
                 return (2, name)  # Process last
             elif "-submissions-001" in name:
@@ -134,46 +148,55 @@ def scan_submissions_files():
         json_files.sort(key=sort_key)
 
         print(f"Found {len(json_files)} submissions JSON files to process")
-        print(f"First 5 files: {[f.name for f in json_files[:5]]}")
-        print(f"Last 5 files: {[f.name for f in json_files[-5:]]}")
+        print(f"First 5 files: {[name for name, _ in json_files[:5]]}")
+        print(f"Last 5 files: {[name for name, _ in json_files[-5:]]}")
 
         # Count by type
-        main_files = [f for f in json_files if "-submissions-" not in f.name]
-        sub001_files = [f for f in json_files if "-submissions-001" in f.name]
-        sub002_files = [f for f in json_files if "-submissions-002" in f.name]
+        sub001_count = sum(1 for name, _ in json_files if "-submissions-001" in name)
+        sub002_count = sum(1 for name, _ in json_files if "-submissions-002" in name)
+        main_count = sum(1 for name, _ in json_files if "-submissions-" not in name)
 
         print(f"File breakdown:")
-        print(f"  Main files: {len(main_files)}")
-        print(f"  Submissions-001 files: {len(sub001_files)}")
-        print(f"  Submissions-002 files: {len(sub002_files)}")
+        print(f"  Main files: {main_count}")
+        print(f"  Submissions-001 files: {sub001_count}")
+        print(f"  Submissions-002 files: {sub002_count}")
 
-        # Return file paths as strings for XCom
-        file_paths = [str(f) for f in json_files]
-        return file_paths
+        # Write the file paths to a per-run manifest and return only its path
+        manifest_path = (
+            MANIFEST_DIR / f"sec_submissions_manifest_{context['run_id']}.txt"
+        )
+        manifest_path.write_text("\n".join(path for _, path in json_files))
+        print(f"Wrote file manifest: {manifest_path}")
+        return str(manifest_path)
 
     except Exception as e:
         print(f"Error scanning submissions JSON files: {e}")
         import traceback
 
         traceback.print_exc()
-        return []
+        return None
 
 
 def process_all_submissions_files(**context):
     """Process all submissions JSON files and track extraction vs insertion metrics"""
+    # Get the manifest path from the previous task via XCom. A missing
+    # manifest fails the task instead of reporting an empty run
+    manifest_path = context["task_instance"].xcom_pull(
+        task_ids="scan_submissions_files"
+    )
+    if not manifest_path:
+        raise ValueError("Scan task returned no file manifest")
+    file_paths = Path(manifest_path).read_text().splitlines()
+
     try:
         from database.config.config import Config
         from data_pipeline.ingestion.json_extractor_submissions import (
             SECSubmissionsExtractor,
         )
 
-        # Get file paths from the previous task via XCom
-        file_paths = context["task_instance"].xcom_pull(
-            task_ids="scan_submissions_files"
-        )
-
         if not file_paths:
             print("No submissions files to process from scan task")
+            Path(manifest_path).unlink(missing_ok=True)
             return {
                 "files_processed": 0,
                 "files_successful": 0,
@@ -195,33 +218,21 @@ def process_all_submissions_files(**context):
         total_records_processed = 0
         failed_file_details = []
 
-        # Process each file individually (similar to test script)
-        for i, json_file in enumerate(json_files, 1):
+        # Process all files through one session; filings from consecutive
+        # files are upserted together instead of committing per file
+        results = extractor.process_files_streaming(json_files)
+
+        for json_file, result in zip(json_files, results):
             filename = json_file.name
-            print(f"\n[{i}/{len(json_files)}] Processing {filename}...")
-
-            try:
-                # Process the single file
-                result = extractor.process_single_file(json_file)
-
-                if result["status"] == "success":
-                    successful_files += 1
-                    total_records_processed += result.get("total_records", 0)
-                    print(f"Successfully processed {filename}")
-                    print(f"   CIK: {result.get('cik', 'N/A')}")
-                    print(f"   Records: {result.get('total_records', 0):,}")
-                else:
-                    failed_files += 1
-                    error_msg = result.get("error", "Unknown error")
-                    failed_file_details.append(f"{filename}: {error_msg}")
-                    print(f"Failed to process {filename}: {error_msg}")
-
-            except Exception as e:
+
+            if result["status"] == "success":
+                successful_files += 1
+                total_records_processed += result.get("total_records", 0)
+            else:
                 failed_files += 1
-                error_msg = str(e)
+                error_msg = result.get("error", "Unknown error")
                 failed_file_details.append(f"{filename}: {error_msg}")
-                print(f"Error processing {filename}: {error_msg}")
-                continue
+                print(f"Failed to process {filename}: {error_msg}")
 
         print(f"\n=== SUBMISSIONS PROCESSING SUMMARY ===")
         print(f"Files Processed: {len(json_files)}")
@@ -248,6 +259,10 @@ def process_all_submissions_files(**context):
             "success_rate": success_rate,
         }
 
+        # Each run writes its own manifest; remove it only after a completed
+        # run, so clearing the task after a failure can still read it
+        Path(manifest_path).unlink(missing_ok=True)
+
         return metrics
 
     except Exception as e:
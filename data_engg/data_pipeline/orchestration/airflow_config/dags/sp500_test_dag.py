@@ -1,7 +1,6 @@
 from datetime import datetime, timedelta
-from airflow import DAG
+from airflow.decorators import dag, task
 from airflow.operators.bash import BashOperator
-from airflow.operators.python import PythonOperator
 
 # Default arguments for the DAG
 default_args = {
@@ -12,39 +11,41 @@ default_args = {
     "email_on_retry": False,
     "retries": 1,
     "retry_delay": timedelta(minutes=5),
+    # Run in a bounded pool (created by setup_airflow.sh) so DAGs copied from
+    # this template can't flood the scheduler
+    "pool": "sp500_ingest",
+    "pool_slots": 1,
+    "priority_weight": 10,
 }
 
-# Create the DAG
-dag = DAG(
-    "sp500_data_pipeline_test",
+
+# Create the DAG with the TaskFlow API
+@dag(
+    dag_id="sp500_data_pipeline_test",
     default_args=default_args,
     description="Test DAG for SP500 data pipeline",
     schedule_interval=timedelta(days=1),
     catchup=False,
+    max_active_runs=1,
+    max_active_tasks=4,
     tags=["sp500", "test", "data-pipeline"],
 )
+def sp500_data_pipeline_test():
+    # Bash task
+    bash_task = BashOperator(
+        task_id="test_bash_task",
+        bash_command='echo "SP500 Data Pipeline Test - Bash Task Executed Successfully!"',
+    )
 
+    # Python task
+    @task
+    def test_python_task():
+        """Test Python task"""
+        print("SP500 Data Pipeline Test - Python Task Executed Successfully!")
+        return "Python task completed"
 
-# Define tasks
-def test_python_task():
-    """Test Python task"""
-    print("SP500 Data Pipeline Test - Python Task Executed Successfully!")
-    return "Python task completed"
-
+    # Set task dependencies
+    bash_task >> test_python_task()
 
-# Bash task
-bash_task = BashOperator(
-    task_id="test_bash_task",
-    bash_command='echo "SP500 Data Pipeline Test - Bash Task Executed Successfully!"',
-    dag=dag,
-)
-
-# Python task
-python_task = PythonOperator(
-    task_id="test_python_task",
-    python_callable=test_python_task,
-    dag=dag,
-)
 
-# Set task dependencies
-bash_task >> python_task
+dag = sp500_data_pipeline_test()
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv
 
@@ -12,3 +13,11 @@ class Config:
         self.tidb_password = os.getenv("TIDB_PASSWORD", "")
         self.tidb_db_name = os.getenv("TIDB_DB_NAME", "test")
         self.ca_path = os.getenv("CA_PATH", "")
+        self.db_pool_size = int(os.getenv("DB_POOL_SIZE", "25"))
+        self.db_max_overflow = int(os.getenv("DB_MAX_OVERFLOW", "25"))
+
+
+@lru_cache(maxsize=None)
+def get_config() -> Config:
+    """Return the process-wide Config, reading .env and the environment once"""
+    return Config()
@@ -3,446 +3,729 @@
 Database Table Creation Script
 
 This script creates database tables without using Alembic migrations.
-It uses SQLAlchemy to create tables directly from model definitions.
+It uses SQLAlchemy to create tables directly from the model definitions in
+database/models. The database engine is imported on first use, so importing
+this module (or the models) does not open a connection pool.
 
 Usage:
     python create_tables.py
 """
 
+import csv
+import logging
+import pickle
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
 from pathlib import Path
-from sqlalchemy import (
-    Column,
-    Integer,
-    String,
-    Date,
-    Numeric,
-    DECIMAL,
-    Text,
-    DateTime,
-    BigInteger,
-    create_engine,
-)
-from sqlalchemy.orm import declarative_base
-from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+from sqlalchemy import bindparam, func, select, text
+from sqlalchemy import inspect as sa_inspect
 
 # Add parent directories to path for imports - system independent
 current_dir = Path(__file__).parent.absolute()
 data_engg_root = current_dir.parent  # Go up to data_engg/
 sys.path.insert(0, str(data_engg_root))
 
-# Import database connection
-try:
-    from database.db_connection import engine, Session
-    from database.config.config import Config
+logger = logging.getLogger(__name__)
 
-    print("Database modules imported successfully")
+# Import model definitions; each module registers its tables on the shared Base
+try:
+    from database.models.base import Base
+    from database.models.sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
+    from database.models.sec_submissions_raw import BronzeSecSubmissions
+    from database.models.sp500_raw import (
+        Sp500StockData,
+        Sp500WikiList,
+        Sp500ComponentChanges,
+        Sp500FinnhubNews,
+        Sp500CorporateActions,
+    )
 except ImportError as e:
-    print(f"Error importing database modules: {e}")
-    print(f"Data engg root: {data_engg_root}")
-    print("Make sure you're running from the correct directory and modules exist.")
+    logger.error(f"Error importing database modules: {e}")
+    logger.error(f"Data engg root: {data_engg_root}")
+    logger.error(
+        "Make sure you're running from the correct directory and modules exist."
+    )
     sys.exit(1)
 
-Base = declarative_base()
-
-
-# SEC Tables - copied from models folder
-class BronzeSecFacts(Base):
-    """Bronze SEC Facts Data Table"""
-
-    __tablename__ = "bronze_sec_facts"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    cik = Column(String(13), nullable=False)
-    taxonomy = Column(String(64), nullable=False)
-    tag = Column(String(256), nullable=False)
-    unit = Column(String(32), nullable=False)
-    val = Column(Numeric(precision=30, scale=2), nullable=False)
-    fy = Column(Numeric, nullable=True)
-    fp = Column(String(8), nullable=True)
-    start_date = Column(Date, nullable=True)
-    end_date = Column(Date, nullable=True)
-    frame = Column(String(128), nullable=True)
-    form = Column(String(16), nullable=True)
-    filed = Column(Date, nullable=True)
-    accn = Column(String(32), nullable=True)
+# Table of every model, keyed by table name
+TABLES = Base.metadata.tables
 
-    __table_args__ = {"extend_existing": True}
+# Tables in dependency order, for create/drop of all tables
+SORTED_TABLES = Base.metadata.sorted_tables
 
-    def __repr__(self):
-        return f"<BronzeSecFacts(id={self.id}, cik={self.cik}, tag={self.tag}, val={self.val})>"
+# Upper bound on concurrent CREATE TABLE statements in create_all_tables
+MAX_DDL_WORKERS = 8
 
+# Dialects whose DROP TABLE accepts a list of tables
+MULTI_TABLE_DROP_DIALECTS = ("mysql", "mariadb", "postgresql")
 
-class BronzeSecFactsDict(Base):
-    """Bronze SEC Facts Dictionary Table"""
+# Session settings around LOAD DATA in bulk_load_csv(skip_checks=True); the
+# current values are read first and put back afterwards
+MYSQL_GET_CHECKS_SQL = "SELECT @@SESSION.unique_checks, @@SESSION.foreign_key_checks"
+MYSQL_SET_CHECKS_SQL = "SET UNIQUE_CHECKS = %s, FOREIGN_KEY_CHECKS = %s"
 
-    __tablename__ = "bronze_sec_facts_dict"
+# On-disk cache of information_schema results, so repeat --show-tables /
+# --show-columns runs against a remote database skip the catalog queries
+CACHE_PATH = Path("~/.cache/sp500/metadata.pkl").expanduser()
+CACHE_TTL_SECONDS = 60
 
-    # Business key (natural key)
-    taxonomy = Column(String(64), nullable=False)
-    tag = Column(String(256), nullable=False)
+# CLI actions that change the schema or table contents, invalidating the cache
+CACHE_INVALIDATING_ACTIONS = (
+    "drop_all",
+    "recreate",
+    "create",
+    "create_table",
+    "drop_table",
+    "delete_data",
+)
 
-    # Data attributes
-    label = Column(Text, nullable=True)
-    description = Column(Text, nullable=True)
 
-    # Audit attributes
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
-    updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+def _get_engine():
+    """Import the shared engine on first use; keeps module import cheap"""
+    from database.db_connection import engine
+
+    return engine
+
+
+def _get_bulk_load_engine():
+    """Import the LOAD DATA LOCAL INFILE engine on first use"""
+    from database.db_connection import get_bulk_load_engine
+
+    return get_bulk_load_engine()
+
+
+def _connection(conn=None):
+    """Use the caller's connection as-is, or open a transaction on the engine"""
+    return nullcontext(conn) if conn is not None else _get_engine().begin()
+
+
+# Liveness probe for --check-connection
+_PING = text("SELECT 1")
+
+# Size and row statistics of this script's tables; :names expands to the
+# defined table names so unrelated tables in a shared schema are skipped
+_TABLE_INFO_SQL = {
+    "mysql": text(
+        """
+        SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH
+        FROM information_schema.TABLES
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME IN :names
+        ORDER BY TABLE_NAME
+        """
+    ).bindparams(bindparam("names", expanding=True)),
+    "postgresql": text(
+        """
+        SELECT c.relname, CAST(c.reltuples AS BIGINT),
+               pg_relation_size(c.oid), pg_indexes_size(c.oid)
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = current_schema() AND c.relkind = 'r'
+          AND c.relname IN :names
+        ORDER BY c.relname
+        """
+    ).bindparams(bindparam("names", expanding=True)),
+}
+
+# Columns of this script's tables in one information_schema query (the schema
+# filter is the only dialect difference); used instead of one reflection
+# round trip per table
+_COLUMNS_SQL = {
+    dialect: text(
+        f"""
+        SELECT table_name, column_name, data_type, is_nullable
+        FROM information_schema.columns
+        WHERE table_schema = {schema} AND table_name IN :names
+        ORDER BY table_name, ordinal_position
+        """
+    ).bindparams(bindparam("names", expanding=True))
+    for dialect, schema in (
+        ("mysql", "DATABASE()"),
+        ("mariadb", "DATABASE()"),
+        ("postgresql", "current_schema()"),
     )
-
-    __table_args__ = {"extend_existing": True}
-
-    def __repr__(self):
-        return f"<BronzeSecFactsDict(id={self.id}, taxonomy={self.taxonomy}, tag={self.tag})>"
-
-
-class BronzeSecSubmissions(Base):
-    """Bronze SEC Submissions Data Table"""
-
-    __tablename__ = "bronze_sec_submissions"
-
-    # Composite Primary Key (based on your analysis)
-    cik = Column(String(13), primary_key=True, nullable=False)
-    accession_number = Column(String(25), primary_key=True, nullable=False)
-    filing_date = Column(Date, primary_key=True, nullable=False)
-    acceptance_datetime = Column(DateTime, primary_key=True, nullable=False)
-
-    # Additional data fields
-    report_date = Column(Date, nullable=True)
-    act = Column(Text, nullable=True)
-    form = Column(Text, nullable=True)
-    file_number = Column(Text, nullable=True)
-    film_number = Column(BigInteger, nullable=True)
-    items = Column(Text, nullable=True)
-    size = Column(Integer, nullable=True)
-    is_xbrl = Column(Integer, nullable=True)
-    is_inline_xbrl = Column(Integer, nullable=True)
-    primary_document = Column(Text, nullable=True)
-    primary_doc_description = Column(Text, nullable=True)
-
-    __table_args__ = {"extend_existing": True}
-
-    def __repr__(self):
-        return f"<BronzeSecSubmissions(cik={self.cik}, accession_number={self.accession_number}, form={self.form})>"
-
-
-class Sp500StockData(Base):
-    """S&P 500 Stock Data Table"""
-
-    __tablename__ = "sp500_stooq_ohcl"
-
-    ticker = Column(String(10), primary_key=True, nullable=False)
-    date = Column(Date, primary_key=True, nullable=False)
-    open = Column(Numeric(precision=15, scale=4), nullable=True)
-    high = Column(Numeric(precision=15, scale=4), nullable=True)
-    low = Column(Numeric(precision=15, scale=4), nullable=True)
-    close = Column(Numeric(precision=15, scale=4), nullable=True)
-    volume = Column(BigInteger, nullable=True)
-
-    __table_args__ = {"extend_existing": True}
-
-    def __repr__(self):
-        return f"<Sp500StockData(ticker={self.ticker}, date={self.date}, close={self.close})>"
-
-
-class Sp500WikiList(Base):
-    """S&P 500 Wiki List Table"""
-
-    __tablename__ = "sp500_wik_list"
-
-    symbol = Column(String(10), primary_key=True, nullable=False)
-    date_added = Column(Date, primary_key=True, nullable=False)
-    security = Column(String(255), nullable=True)
-    gics_sector = Column(String(255), nullable=True)
-    gics_sub_ind = Column(String(255), nullable=True)
-    headquarters_loc = Column(String(255), nullable=True)
-    cik = Column(String(20), nullable=True)
-    founded = Column(String(50), nullable=True)
-
-    __table_args__ = {"extend_existing": True}
-
-    def __repr__(self):
-        return f"<Sp500WikiList(symbol={self.symbol}, date_added={self.date_added}, security={self.security})>"
+}
 
 
-class Sp500ComponentChanges(Base):
-    """S&P 500 Component Changes Table"""
-
-    __tablename__ = "selected_changes_sp500"
-
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    effective_date = Column(Date, nullable=False)
-    added_ticker = Column(String(10), nullable=True)
-    added_security = Column(String(255), nullable=True)
-    removed_ticker = Column(String(10), nullable=True)
-    removed_security = Column(String(255), nullable=True)
-    reason = Column(Text, nullable=True)
-
-    __table_args__ = {"extend_existing": True}
-
-    def __repr__(self):
-        return f"<Sp500ComponentChanges(effective_date={self.effective_date}, added_ticker={self.added_ticker}, removed_ticker={self.removed_ticker})>"
-
-
-class Sp500FinnhubNews(Base):
-    """S&P 500 Finnhub News Table"""
-
-    __tablename__ = "sp500_finnhub_news"
+def _read_cache() -> Dict[Any, Any]:
+    """Load the metadata cache; a missing or unreadable file is an empty cache"""
+    try:
+        with CACHE_PATH.open("rb") as f:
+            return pickle.load(f)
+    except (OSError, EOFError, pickle.PickleError):
+        return {}
+
+
+def _cached(conn, key: str, loader: Callable[[], Any]) -> Any:
+    """
+    Return the cached result of loader for this database, or run it and
+    store the result when the entry is missing or older than
+    CACHE_TTL_SECONDS. Entries are keyed by the (password-masked) database
+    URL so different databases never share results.
+    """
+    cache_key = (key, str(conn.engine.url))
+    cache = _read_cache()
+
+    entry = cache.get(cache_key)
+    if entry is not None and time.time() - entry[0] < CACHE_TTL_SECONDS:
+        return entry[1]
+
+    value = loader()
+    cache[cache_key] = (time.time(), value)
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with CACHE_PATH.open("wb") as f:
+            pickle.dump(cache, f)
+    except OSError as e:
+        logger.debug(f"Could not write metadata cache: {e}")
+    return value
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    symbol = Column(String(10), nullable=False)
-    news_id = Column(String(50), nullable=False)
-    datetime = Column(DateTime, nullable=False)
-    headline = Column(Text, nullable=True)
-    summary = Column(Text, nullable=True)
-    source = Column(String(200), nullable=True)
-    url = Column(Text, nullable=True)
-    image = Column(Text, nullable=True)
-    related = Column(String(10), nullable=True)
-    category = Column(String(100), nullable=True)
 
-    __table_args__ = {"extend_existing": True}
+def clear_cache():
+    """Remove the on-disk metadata cache"""
+    CACHE_PATH.unlink(missing_ok=True)
 
-    def __repr__(self):
-        return f"<Sp500FinnhubNews(symbol={self.symbol}, datetime={self.datetime}, headline={self.headline[:50]}...)>"
 
+def _iter_models():
+    """Yield the mapped model classes registered on the shared Base"""
+    yield from Base.__subclasses__()
 
-class Sp500CorporateActions(Base):
-    """S&P 500 Corporate Actions Table"""
 
-    __tablename__ = "sp500_corporate_actions"
+# Model class for each table name, built once after all models are defined
+TABLE_REGISTRY = {cls.__tablename__: cls for cls in _iter_models()}
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    symbol = Column(String(10), nullable=False)
-    event_type = Column(String(50), nullable=False)
-    ex_date = Column(Date, nullable=True)
-    record_date = Column(Date, nullable=True)
-    pay_date = Column(Date, nullable=True)
-    ratio = Column(String(50), nullable=True)
-    cash_amount = Column(DECIMAL(15, 6), nullable=True)
+# Sorted table names for listings and not-found messages, sorted once
+AVAILABLE_TABLE_NAMES = sorted(TABLE_REGISTRY)
 
-    __table_args__ = {"extend_existing": True}
 
-    def __repr__(self):
-        return f"<Sp500CorporateActions(id={self.id}, symbol={self.symbol}, ex_date={self.ex_date}, event_type={self.event_type})>"
+def _resolve_table(table_name: str):
+    """Look up a model class by table name, logging the choices when unknown"""
+    table_class = TABLE_REGISTRY.get(table_name)
+    if table_class is None:
+        logger.error(f"✗ Table '{table_name}' not found in defined tables")
+        logger.info(f"Available tables: {', '.join(AVAILABLE_TABLE_NAMES)}")
+    return table_class
 
 
-def create_specific_table(table_name: str):
+def create_specific_table(
+    table_name: str, conn=None, existing_tables: Optional[Iterable[str]] = None
+):
+    """
+    Create a specific table by name. Callers that have already listed the
+    database's tables can pass them as existing_tables to skip the
+    per-table existence check.
+    """
     try:
-        print(f"Creating table: {table_name}")
-        print("=" * 50)
+        logger.info(f"Creating table: {table_name}")
 
         # Get the table class by name
-        table_class = None
-        for name, obj in globals().items():
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, Base)
-                and hasattr(obj, "__tablename__")
-                and obj.__tablename__ == table_name
-            ):
-                table_class = obj
-                break
-
-        if not table_class:
-            print(f"✗ Table '{table_name}' not found in defined tables")
-            available_tables = list_available_tables()
-            print(f"Available tables: {', '.join(available_tables)}")
+        table_class = _resolve_table(table_name)
+        if table_class is None:
             return False
 
+        if existing_tables is not None and table_name in existing_tables:
+            logger.info(f"✓ Table '{table_name}' already exists")
+            return True
+
         # Create the specific table
-        table_class.__table__.create(engine, checkfirst=True)
-        print(f"✓ Table '{table_name}' created successfully")
+        with _connection(conn) as conn:
+            table_class.__table__.create(conn, checkfirst=existing_tables is None)
+        logger.info(f"✓ Table '{table_name}' created successfully")
         return True
 
     except Exception as e:
-        print(f"✗ Error creating table '{table_name}': {e}")
+        logger.error(f"✗ Error creating table '{table_name}': {e}")
         return False
 
 
-def drop_specific_table(table_name: str):
-    """Drop a specific table by name"""
+def drop_specific_table(
+    table_name: str, conn=None, existing_tables: Optional[Iterable[str]] = None
+):
+    """
+    Drop a specific table by name; existing_tables skips the existence
+    check as in create_specific_table.
+    """
     try:
-        print(f"Dropping table: {table_name}")
-        print("=" * 50)
+        logger.info(f"Dropping table: {table_name}")
 
         # Get the table class by name
-        table_class = None
-        for name, obj in globals().items():
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, Base)
-                and hasattr(obj, "__tablename__")
-                and obj.__tablename__ == table_name
-            ):
-                table_class = obj
-                break
-
-        if not table_class:
-            print(f"✗ Table '{table_name}' not found in defined tables")
-            available_tables = list_available_tables()
-            print(f"Available tables: {', '.join(available_tables)}")
+        table_class = _resolve_table(table_name)
+        if table_class is None:
             return False
 
+        if existing_tables is not None and table_name not in existing_tables:
+            logger.info(f"✓ Table '{table_name}' does not exist")
+            return True
+
         # Drop the specific table
-        table_class.__table__.drop(engine, checkfirst=True)
-        print(f"✓ Table '{table_name}' dropped successfully")
+        with _connection(conn) as conn:
+            table_class.__table__.drop(conn, checkfirst=existing_tables is None)
+        logger.info(f"✓ Table '{table_name}' dropped successfully")
         return True
 
     except Exception as e:
-        print(f"✗ Error dropping table '{table_name}': {e}")
+        logger.error(f"✗ Error dropping table '{table_name}': {e}")
         return False
 
 
-def delete_all_data_from_table(table_name: str):
-    """Delete all data from a specific table by name"""
+def delete_all_data_from_table(
+    table_name: str, count_rows: bool = False, conn=None, truncate: bool = True
+):
+    """
+    Delete all data from a specific table by name in a single statement.
+    Uses TRUNCATE where the dialect has it (no per-row work on the server or
+    client), otherwise, or with truncate=False when DDL semantics such as
+    MySQL's implicit commit are unwanted, a Core DELETE whose rowcount is
+    reported. count_rows=True adds a row count before deleting. Runs on conn
+    when given, else in its own transaction.
+    """
     try:
-        print(f"Deleting all data from table: {table_name}")
-        print("=" * 50)
+        logger.info(f"Deleting all data from table: {table_name}")
 
         # Get the table class by name
-        table_class = None
-        for name, obj in globals().items():
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, Base)
-                and hasattr(obj, "__tablename__")
-                and obj.__tablename__ == table_name
-            ):
-                table_class = obj
-                break
-
-        if not table_class:
-            print(f"✗ Table '{table_name}' not found in defined tables")
-            available_tables = [
-                cls.__tablename__
-                for cls in Base.registry._class_registry.values()
-                if hasattr(cls, "__tablename__")
-            ]
-            print(f"Available tables: {', '.join(available_tables)}")
+        table_class = _resolve_table(table_name)
+        if table_class is None:
             return False
 
-        # Delete all data from the table
-        with Session() as session:
-            # Get count before deletion
-            count_query = session.query(table_class).count()
-            print(f"Records to be deleted: {count_query:,}")
+        # Delete all data from the table in one transaction
+        table = table_class.__table__
+        deleted = None
 
-            if count_query == 0:
-                print("✓ Table is already empty")
-                return True
+        with _connection(conn) as conn:
+            dialect = conn.dialect
+            table_sql = dialect.identifier_preparer.format_table(table)
 
-            # Delete all records
-            session.query(table_class).delete()
-            session.commit()
+            if count_rows:
+                # Get count before deletion
+                deleted = conn.execute(select(func.count()).select_from(table)).scalar()
+                logger.info(f"Records to be deleted: {deleted:,}")
 
-            print(f"✓ Successfully deleted {count_query:,} records from '{table_name}'")
-            return True
+                if deleted == 0:
+                    logger.info("✓ Table is already empty")
+                    return True
+
+            if truncate and dialect.name == "postgresql":
+                conn.execute(text(f"TRUNCATE TABLE {table_sql} RESTART IDENTITY"))
+            elif truncate and dialect.name in ("mysql", "mariadb"):
+                conn.execute(text(f"TRUNCATE TABLE {table_sql}"))
+            else:
+                deleted = conn.execute(table.delete()).rowcount
+
+        if deleted is None:
+            logger.info(f"✓ Successfully deleted all records from '{table_name}'")
+        else:
+            logger.info(
+                f"✓ Successfully deleted {deleted:,} records from '{table_name}'"
+            )
+        return True
 
     except Exception as e:
-        print(f"✗ Error deleting data from table '{table_name}': {e}")
+        logger.error(f"✗ Error deleting data from table '{table_name}': {e}")
         return False
 
 
-def list_available_tables():
-    print("Available Tables:")
-    print("=" * 50)
+def bulk_insert(
+    table_name: str, rows: Iterable[Dict[str, Any]], batch_size: int = 10_000
+) -> int:
+    """
+    Insert rows into a table by name with Core executemany, batch_size rows per
+    call, all in one transaction. Rows are consumed lazily, so a generator over
+    a file is never materialized in full; PyMySQL rewrites each executemany
+    into multi-row INSERT ... VALUES statements.
+
+    Args:
+        table_name: Name of a table defined in this script
+        rows: Iterable of column-name -> value dictionaries
+        batch_size: Number of rows sent per executemany call
+
+    Returns:
+        Number of rows inserted
+    """
+    table = TABLES.get(table_name)
+    if table is None:
+        raise ValueError(f"Table '{table_name}' not found in defined tables")
+
+    insert_stmt = table.insert()
+    rows_iter = iter(rows)
+    inserted = 0
+
+    with _get_engine().begin() as conn:
+        while batch := list(islice(rows_iter, batch_size)):
+            conn.execute(insert_stmt, batch)
+            inserted += len(batch)
+
+    return inserted
+
+
+def bulk_load_csv(table_name: str, csv_path: str, skip_checks: bool = False) -> int:
+    """
+    Bulk-load a CSV file with a header row into a table by name with
+    LOAD DATA LOCAL INFILE on a raw DBAPI connection from the dedicated
+    bulk-load engine (MySQL/TiDB, the engine's target), the only engine
+    with local_infile enabled. Empty fields load as NULL. Other dialects
+    fall back to bulk_insert.
+
+    skip_checks=True opts in to turning off UNIQUE_CHECKS and
+    FOREIGN_KEY_CHECKS for the load, so secondary unique indexes (such as
+    bronze_sec_facts_dict's (taxonomy, tag)) and foreign keys are not
+    verified row by row. The primary key is still enforced; only use it for
+    files known to be free of duplicates. The session's previous settings
+    are restored afterwards.
+
+    Args:
+        table_name: Name of a table defined in this script
+        csv_path: Path to a CSV whose header names the table's columns
+        skip_checks: Disable unique/foreign key checks during a MySQL load
+
+    Returns:
+        Number of rows loaded
+    """
+    table = TABLES.get(table_name)
+    if table is None:
+        raise ValueError(f"Table '{table_name}' not found in defined tables")
+
+    with open(csv_path, newline="") as f:
+        columns = next(csv.reader(f))
+    unknown = set(columns) - set(table.columns.keys())
+    if unknown:
+        raise ValueError(f"Unknown columns for '{table_name}': {sorted(unknown)}")
+
+    engine = _get_engine()
+
+    if engine.dialect.name not in ("mysql", "mariadb"):
+        with open(csv_path, newline="") as f:
+            rows = (
+                {column: value or None for column, value in row.items()}
+                for row in csv.DictReader(f)
+            )
+            return bulk_insert(table_name, rows)
 
-    available_tables = []
-    for name, obj in globals().items():
-        if (
-            isinstance(obj, type)
-            and issubclass(obj, Base)
-            and hasattr(obj, "__tablename__")
-        ):
-            table_name = obj.__tablename__
-            doc = obj.__doc__ or "No description"
-            available_tables.append((table_name, doc))
+    preparer = engine.dialect.identifier_preparer
+    table_sql = preparer.format_table(table)
+    column_sql = [preparer.quote(column) for column in columns]
 
-    for table_name, description in sorted(available_tables):
-        print(f"  - {table_name:<25} : {description}")
+    raw = _get_bulk_load_engine().raw_connection()
+    try:
+        cursor = raw.cursor()
 
-    return [table[0] for table in available_tables]
+        # Read fields into user variables so empty strings become NULL
+        variables = [f"@v{i}" for i in range(len(columns))]
+        assignments = ", ".join(
+            f"{column} = NULLIF({variable}, '')"
+            for column, variable in zip(column_sql, variables)
+        )
+        load_sql = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table_sql} "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            "LINES TERMINATED BY '\\n' IGNORE 1 LINES "
+            f"({', '.join(variables)}) SET {assignments}"
+        )
+        if skip_checks:
+            cursor.execute(MYSQL_GET_CHECKS_SQL)
+            saved_checks = cursor.fetchone()
+            cursor.execute(MYSQL_SET_CHECKS_SQL, (0, 0))
+        try:
+            cursor.execute(load_sql, (str(csv_path),))
+            loaded = cursor.rowcount
+        finally:
+            # Session variables outlive this call on the pooled connection
+            if skip_checks:
+                cursor.execute(MYSQL_SET_CHECKS_SQL, saved_checks)
 
+        raw.commit()
+    finally:
+        raw.close()
 
-def create_all_tables():
-    try:
-        print("Creating database tables...")
-        print("=" * 50)
+    return loaded
+
+
+def list_available_tables():
+    logger.info("Available Tables:")
+
+    for table_name in AVAILABLE_TABLE_NAMES:
+        description = TABLE_REGISTRY[table_name].__doc__ or "No description"
+        logger.info(f"  - {table_name:<25} : {description}")
 
-        # Create all tables
-        Base.metadata.create_all(engine)
+    return list(AVAILABLE_TABLE_NAMES)
 
-        print("Successfully created the following tables:")
-        for table_name in Base.metadata.tables.keys():
-            print(f"  - {table_name}")
 
-        print("\nTable creation completed successfully!")
+def create_all_tables(conn=None, existing_tables: Optional[Iterable[str]] = None):
+    """
+    Create every defined table that does not exist yet. existing_tables,
+    when the caller already knows it, replaces the table-name lookup.
+    """
+    try:
+        logger.info("Creating database tables...")
+
+        # Fetch the existing table names once instead of letting create_all
+        # check each table separately, then create only the missing ones
+        bind = conn if conn is not None else _get_engine()
+        if existing_tables is None:
+            existing_tables = sa_inspect(bind).get_table_names()
+        existing = set(existing_tables)
+        missing = [table for table in SORTED_TABLES if table.name not in existing]
+
+        if not missing:
+            logger.info("All tables already exist")
+            return True
+
+        if conn is not None:
+            # A single connection runs its statements one after another
+            for table in missing:
+                table.create(conn, checkfirst=False)
+        else:
+            # The tables have no foreign keys between them, so each CREATE
+            # runs on its own pooled connection in parallel instead of one
+            # round trip after another
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_DDL_WORKERS, len(missing))
+            ) as executor:
+                list(
+                    executor.map(
+                        lambda table: table.create(bind, checkfirst=False), missing
+                    )
+                )
+
+        logger.info("Successfully created the following tables:")
+        for table in missing:
+            logger.info(f"  - {table.name}")
+
+        logger.info("Table creation completed successfully!")
         return True
 
     except Exception as e:
-        print(f"Error creating tables: {e}")
+        logger.error(f"Error creating tables: {e}")
         return False
 
 
-def drop_all_tables():
+def drop_all_tables(conn=None):
     """Drop all tables defined in this script (use with caution!)"""
     try:
-        print("Dropping database tables...")
-        print("=" * 50)
+        logger.info("Dropping database tables...")
 
-        # Drop all tables
-        Base.metadata.drop_all(engine)
+        with _connection(conn) as conn:
+            # One table-name lookup instead of an existence check per table
+            existing = set(sa_inspect(conn).get_table_names())
+            present = [t for t in reversed(SORTED_TABLES) if t.name in existing]
 
-        print("Successfully dropped all tables!")
+            if not present:
+                logger.info("No tables to drop")
+                return True
+
+            if conn.dialect.name in MULTI_TABLE_DROP_DIALECTS:
+                # A single DROP TABLE a, b, ... statement drops every table in
+                # one round trip
+                preparer = conn.dialect.identifier_preparer
+                table_list = ", ".join(preparer.format_table(t) for t in present)
+                conn.execute(text(f"DROP TABLE {table_list}"))
+            else:
+                # Drop dependents first
+                for table in present:
+                    table.drop(conn, checkfirst=False)
+
+        logger.info("Successfully dropped the following tables:")
+        for table in present:
+            logger.info(f"  - {table.name}")
         return True
 
     except Exception as e:
-        print(f"Error dropping tables: {e}")
+        logger.error(f"Error dropping tables: {e}")
         return False
 
 
-def show_table_info():
+def show_table_info(conn=None):
     """Show information about existing tables"""
     try:
-        with Session() as session:
-            # Get table information
-            tables_query = """
-                SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH
-                FROM information_schema.TABLES 
-                WHERE TABLE_SCHEMA = DATABASE()
-                ORDER BY TABLE_NAME
-            """
-
-            result = session.execute(tables_query)
-            tables = result.fetchall()
-
-            print("Existing Tables:")
-            print("=" * 60)
-            print(
+        with _connection(conn) as conn:
+            # information_schema.TABLES.TABLE_ROWS is MySQL-specific;
+            # PostgreSQL reads the same figures from pg_class
+            dialect = "postgresql" if conn.dialect.name == "postgresql" else "mysql"
+
+            # Get table information (from the cache when it is fresh)
+            tables = _cached(
+                conn,
+                "table_info",
+                lambda: [
+                    tuple(row)
+                    for row in conn.execute(
+                        _TABLE_INFO_SQL[dialect], {"names": list(TABLES)}
+                    )
+                ],
+            )
+
+            logger.info("Existing Tables:")
+            logger.info(
                 f"{'Table Name':<25} {'Rows':<15} {'Data Size':<15} {'Index Size':<15}"
             )
-            print("-" * 60)
+            logger.info("-" * 60)
 
             for table in tables:
                 table_name, rows, data_size, index_size = table
                 rows_str = f"{rows:,}" if rows else "N/A"
                 data_str = f"{data_size:,}" if data_size else "N/A"
                 index_str = f"{index_size:,}" if index_size else "N/A"
-                print(f"{table_name:<25} {rows_str:<15} {data_str:<15} {index_str:<15}")
+                logger.info(
+                    f"{table_name:<25} {rows_str:<15} {data_str:<15} {index_str:<15}"
+                )
+
+    except Exception as e:
+        logger.error(f"Error getting table info: {e}")
+
+
+def get_all_columns(conn=None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Reflect the columns of every defined table that exists in the database
+    with a single information_schema query on MySQL/TiDB and PostgreSQL.
+    Other dialects share one Inspector (and its cache) across the tables.
+    Results are served from the on-disk cache for CACHE_TTL_SECONDS.
+
+    Args:
+        conn: Connection to use; a new transaction is opened when omitted
+
+    Returns:
+        Mapping of table name to a list of {"name", "type", "nullable"} dicts
+    """
+    with _connection(conn) as conn:
+        return _cached(conn, "columns", lambda: _load_columns(conn))
+
+
+def _load_columns(conn) -> Dict[str, List[Dict[str, Any]]]:
+    """Query the columns of every defined table for get_all_columns"""
+    columns: Dict[str, List[Dict[str, Any]]] = {}
+
+    statement = _COLUMNS_SQL.get(conn.dialect.name)
+
+    if statement is not None:
+        result = conn.execute(statement, {"names": list(TABLES)})
+        for table_name, name, data_type, is_nullable in result:
+            columns.setdefault(table_name, []).append(
+                {"name": name, "type": data_type, "nullable": is_nullable == "YES"}
+            )
+    else:
+        inspector = sa_inspect(conn)
+        existing = set(inspector.get_table_names())
+        for table_name in AVAILABLE_TABLE_NAMES:
+            if table_name in existing:
+                columns[table_name] = [
+                    {
+                        "name": column["name"],
+                        "type": str(column["type"]),
+                        "nullable": column["nullable"],
+                    }
+                    for column in inspector.get_columns(table_name)
+                ]
+
+    return columns
+
+
+def show_table_columns(conn=None):
+    """Show the columns of existing tables"""
+    try:
+        for table_name, columns in get_all_columns(conn).items():
+            logger.info(f"{table_name}:")
+            for column in columns:
+                null_str = "NULL" if column["nullable"] else "NOT NULL"
+                logger.info(f"  - {column['name']:<25} {column['type']:<15} {null_str}")
 
     except Exception as e:
-        print(f"Error getting table info: {e}")
+        logger.error(f"Error getting table columns: {e}")
+
+
+def check_connection(conn=None):
+    """Run an explicit SELECT 1 round trip against the database"""
+    try:
+        with _connection(conn) as conn:
+            conn.execute(_PING)
+        logger.info("Database connection successful")
+        return True
+
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        return False
+
+
+def recreate_all_tables(conn=None):
+    """Drop and recreate all tables defined in this script"""
+    # None of the tables exist after the drop, so skip the lookup
+    return drop_all_tables(conn) and create_all_tables(conn, existing_tables=())
+
+
+def confirm_action(prompt: str, assume_yes: bool = False) -> bool:
+    """Ask for a yes/no confirmation; assume_yes (--yes) skips the prompt"""
+    return assume_yes or input(prompt).lower() == "yes"
+
+
+# CLI actions in execution order: (argparse dest, handler, confirmation).
+# Handlers receive the parsed arguments and the CLI's shared connection; a
+# non-None confirmation describes the destructive action and is formatted with
+# the arguments before prompting
+ACTIONS = [
+    ("check_connection", lambda args, conn: check_connection(conn), None),
+    ("show_tables", lambda args, conn: show_table_info(conn), None),
+    ("show_columns", lambda args, conn: show_table_columns(conn), None),
+    ("drop_all", lambda args, conn: drop_all_tables(conn), "drop all tables"),
+    (
+        "recreate",
+        lambda args, conn: recreate_all_tables(conn),
+        "recreate all tables",
+    ),
+    ("create", lambda args, conn: create_all_tables(conn), None),
+    (
+        "create_table",
+        lambda args, conn: create_specific_table(args.create_table, conn),
+        None,
+    ),
+    (
+        "drop_table",
+        lambda args, conn: drop_specific_table(args.drop_table, conn),
+        "drop table '{drop_table}'",
+    ),
+    (
+        "delete_data",
+        lambda args, conn: delete_all_data_from_table(
+            args.delete_data, count_rows=not args.yes, conn=conn
+        ),
+        "delete all data from table '{delete_data}'",
+    ),
+    ("list_available", lambda args, conn: list_available_tables(), None),
+]
+
+# ACTIONS whose handler ignores the connection; main() runs them without one
+CONNECTION_FREE_ACTIONS = ("list_available",)
+
+USAGE_EXAMPLES = """example usage:
+  python create_tables.py --check-connection
+  python create_tables.py --create
+  python create_tables.py --create-table sp500_stooq_ohcl
+  python create_tables.py --drop-table sp500_wik_list
+  python create_tables.py --delete-data sp500_stooq_ohcl
+  python create_tables.py --delete-data sp500_stooq_ohcl --yes
+  python create_tables.py --list-available
+  python create_tables.py --show-tables --refresh-cache
+"""
 
 
 def main():
     """Main function"""
     import argparse
 
-    parser = argparse.ArgumentParser(description="Database Table Creation Tool")
+    # Plain messages on stderr for the CLI; importers keep their own config
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    parser = argparse.ArgumentParser(
+        description="Database Table Creation Tool",
+        epilog=USAGE_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--check-connection",
+        action="store_true",
+        help="Test the database connection with a SELECT 1",
+    )
     parser.add_argument("--create", action="store_true", help="Create all tables")
     parser.add_argument(
         "--drop-all", action="store_true", help="Drop all tables (DANGEROUS!)"
@@ -451,101 +734,96 @@ def main():
         "--show-tables", action="store_true", help="Show existing tables"
     )
     parser.add_argument(
-        "--recreate", action="store_true", help="Drop and recreate all tables"
+        "--show-columns", action="store_true", help="Show columns of existing tables"
+    )
+    parser.add_argument(
+        "--recreate",
+        action="store_true",
+        help="Drop and recreate all tables (DANGEROUS!)",
     )
     parser.add_argument(
         "--create-table", type=str, help="Create a specific table by name"
     )
     parser.add_argument("--drop-table", type=str, help="Drop a specific table by name")
     parser.add_argument(
-        "--delete-data", type=str, help="Delete all data from a specific table by name"
+        "--delete-data",
+        type=str,
+        help="Delete all data from a specific table by name (DANGEROUS!)",
     )
     parser.add_argument(
         "--list-available", action="store_true", help="List available table definitions"
     )
+    parser.add_argument(
+        "--refresh-cache",
+        action="store_true",
+        help="Ignore cached --show-tables/--show-columns results and query again",
+    )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        help="Skip confirmation prompts (and the row count before --delete-data)",
+    )
 
     args = parser.parse_args()
 
-    # Test database connection first
-    try:
-        with Session() as session:
-            session.execute("SELECT 1")
-        print("Database connection successful")
-    except Exception as e:
-        print(f"Database connection failed: {e}")
+    # Without an action (no arguments, or only modifiers such as --yes or
+    # --refresh-cache) show help without touching the database
+    if not any(getattr(args, dest) for dest, _, _ in ACTIONS):
+        parser.print_help()
+        if sys.argv[1:]:
+            parser.exit(2, "\nerror: no action given\n")
         return
 
-    # Execute commands
-    if args.show_tables:
-        show_table_info()
-
-    if args.drop_all:
-        confirm = input(
-            "Are you sure you want to drop all tables? This will DELETE ALL DATA! (yes/no): "
-        )
-        if confirm.lower() == "yes":
-            drop_all_tables()
-        else:
-            print("Operation cancelled")
-
-    if args.recreate:
-        confirm = input(
-            "Are you sure you want to recreate all tables? This will DELETE ALL DATA! (yes/no): "
+    # Cached catalog results are stale once the schema or data may change
+    if args.refresh_cache or any(
+        getattr(args, dest) for dest in CACHE_INVALIDATING_ACTIONS
+    ):
+        clear_cache()
+
+    # Requested actions in execution order; destructive ones are confirmed
+    # together with a single prompt before the database is touched
+    requested = [action for action in ACTIONS if getattr(args, action[0])]
+    destructive = [
+        confirmation.format_map(vars(args))
+        for _, _, confirmation in requested
+        if confirmation is not None
+    ]
+    if destructive:
+        prompt = (
+            f"Are you sure you want to {' and '.join(destructive)}? "
+            "This will DELETE ALL DATA and cannot be undone! (yes/no): "
         )
-        if confirm.lower() == "yes":
-            drop_all_tables()
-            create_all_tables()
-        else:
-            print("Operation cancelled")
-
-    if args.create:
-        create_all_tables()
-
-    if args.create_table:
-        create_specific_table(args.create_table)
+        if not confirm_action(prompt, args.yes):
+            logger.info("Operation cancelled")
+            requested = [action for action in requested if action[2] is None]
+
+    # Actions that never use the database run first, without creating the
+    # engine or checking out a connection
+    for dest, handler, _ in requested:
+        if dest in CONNECTION_FREE_ACTIONS:
+            handler(args, None)
+    requested = [a for a in requested if a[0] not in CONNECTION_FREE_ACTIONS]
+
+    if not requested:
+        return
 
-    if args.drop_table:
-        confirm = input(
-            f"Are you sure you want to drop table '{args.drop_table}'? This will DELETE ALL DATA in this table! (yes/no): "
-        )
-        if confirm.lower() == "yes":
-            drop_specific_table(args.drop_table)
-        else:
-            print("Operation cancelled")
+    # Every action runs on one connection and transaction, checked out once;
+    # the engine's pool_pre_ping validates it on checkout, so no separate
+    # test query is sent. Where DDL is transactional (PostgreSQL) a failed
+    # --recreate also rolls back its drops
+    try:
+        conn = _get_engine().connect()
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        return
 
-    if args.delete_data:
-        confirm = input(
-            f"Are you sure you want to delete ALL DATA from table '{args.delete_data}'? This action cannot be undone! (yes/no): "
-        )
-        if confirm.lower() == "yes":
-            delete_all_data_from_table(args.delete_data)
-        else:
-            print("Operation cancelled")
-
-    if args.list_available:
-        list_available_tables()
-
-    # If no arguments provided, show help
-    if not any(vars(args).values()):
-        print("Database Table Creation Tool")
-        print("=" * 50)
-        print("Available commands:")
-        print("  --create              Create all tables")
-        print("  --drop-all            Drop all tables (DANGEROUS!)")
-        print("  --recreate            Drop and recreate all tables (DANGEROUS!)")
-        print("  --show-tables         Show existing tables")
-        print("  --create-table NAME   Create a specific table by name")
-        print("  --drop-table NAME     Drop a specific table by name")
-        print(
-            "  --delete-data NAME    Delete all data from a specific table (DANGEROUS!)"
-        )
-        print("  --list-available      List available table definitions")
-        print("\nExample usage:")
-        print("  python create_tables.py --create")
-        print("  python create_tables.py --create-table sp500_stooq_ohcl")
-        print("  python create_tables.py --drop-table sp500_wik_list")
-        print("  python create_tables.py --delete-data sp500_stooq_ohcl")
-        print("  python create_tables.py --list-available")
+    try:
+        with conn, conn.begin():
+            # Execute commands
+            for _, handler, _ in requested:
+                handler(args, conn)
+    except Exception as e:
+        logger.error(f"Database error: {e}")
 
 
 if __name__ == "__main__":
@@ -1,3 +1,6 @@
+import ssl
+from functools import lru_cache
+
 from sqlalchemy import create_engine
 from sqlalchemy.engine import URL
 from sqlalchemy.orm import sessionmaker
@@ -6,11 +9,22 @@ import sys
 
 # Add the database directory to the path to find config
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-from config.config import Config
+from config.config import get_config
+
+# Seconds a pooled connection is reused before it is replaced
+POOL_RECYCLE_SECONDS = 1800
+
+
+def _ssl_context(ca_path: str) -> ssl.SSLContext:
+    """TLS context that verifies the server certificate and host name"""
+    context = ssl.create_default_context(cafile=ca_path)
+    # Same relaxation PyMySQL applies to contexts it builds itself
+    context.verify_flags &= ~ssl.VERIFY_X509_STRICT
+    return context
 
 
-def get_db_engine():
-    config = Config()
+def get_db_engine(local_infile: bool = False):
+    config = get_config()
     dsn = URL.create(
         drivername="mysql+pymysql",
         username=config.tidb_user,
@@ -19,16 +33,72 @@ def get_db_engine():
         port=config.tidb_port,
         database=config.tidb_db_name,
     )
-    connect_args = {}
+    # local_infile lets the client send files for LOAD DATA LOCAL INFILE; it
+    # also lets the server request any readable local file, so only the
+    # dedicated bulk-load engine turns it on
+    connect_args = {"local_infile": local_infile}
     if config.ca_path:
-        connect_args = {
-            "ssl_verify_cert": True,
-            "ssl_verify_identity": True,
-            "ssl_ca": config.ca_path,
-        }
-    return create_engine(dsn, connect_args=connect_args)
+        # One SSLContext for the whole pool: the CA file is read once here
+        # instead of PyMySQL building a context from ssl_ca on every connect
+        connect_args["ssl"] = _ssl_context(config.ca_path)
+    # Pool sized from Config (DB_POOL_SIZE / DB_MAX_OVERFLOW) for concurrent
+    # loaders; LIFO hands out the most recently used, still-warm connection.
+    # pool_pre_ping replaces connections dropped by a database restart or
+    # idle timeout (e.g. in long-lived Airflow workers) instead of failing the
+    # next statement; pool_recycle retires connections before server timeouts
+    return create_engine(
+        dsn,
+        connect_args=connect_args,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
+        pool_use_lifo=True,
+        pool_pre_ping=True,
+        pool_recycle=POOL_RECYCLE_SECONDS,
+    )
+
+
+@lru_cache(maxsize=None)
+def get_engine():
+    """Return the shared engine, creating it on first use"""
+    return get_db_engine()
+
+
+@lru_cache(maxsize=None)
+def get_bulk_load_engine():
+    """
+    Return the engine used only for LOAD DATA LOCAL INFILE bulk loads,
+    creating it on first use. It is the one engine with local_infile on.
+    """
+    return get_db_engine(local_infile=True)
+
+
+@lru_cache(maxsize=None)
+def get_session_factory():
+    """Return the shared session factory, bound to get_engine()"""
+    # expire_on_commit=False keeps loaded attributes after commit instead of
+    # reloading them with another SELECT on next access
+    return sessionmaker(bind=get_engine(), expire_on_commit=False)
+
+
+@lru_cache(maxsize=None)
+def get_read_only_session_factory():
+    """
+    Return a session factory for read-only work. With nothing to write,
+    autoflush would only add a flush check before every query.
+    """
+    return sessionmaker(bind=get_engine(), autoflush=False, expire_on_commit=False)
 
 
-# Reusable engine and session factory
-engine = get_db_engine()
-Session = sessionmaker(bind=engine)
+def __getattr__(name):
+    """
+    Reusable engine and session factories, resolved lazily (PEP 562) so that
+    importing this module reads no config, certificates or connections until
+    `engine`, `Session` or `ReadOnlySession` is first used.
+    """
+    if name == "engine":
+        return get_engine()
+    if name == "Session":
+        return get_session_factory()
+    if name == "ReadOnlySession":
+        return get_read_only_session_factory()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,43 @@
+"""
+Shared helpers for the Alembic migration scripts in versions/
+"""
+
+from typing import Mapping
+
+from alembic import op
+from sqlalchemy.types import TypeEngine
+
+
+def modify_columns(
+    table_name: str,
+    types: Mapping[str, TypeEngine],
+    existing_types: Mapping[str, TypeEngine],
+) -> None:
+    """
+    Change nullable columns of one table to the given types. MySQL/TiDB get
+    one ALTER TABLE with a MODIFY clause per column, so the table is
+    rewritten once (TiDB runs it as a single multi-schema change); other
+    dialects alter the columns one by one.
+
+    Args:
+        table_name: Table whose columns change
+        types: New type per column name
+        existing_types: Current type per column name
+    """
+    dialect = op.get_context().dialect
+    if dialect.name in ("mysql", "mariadb"):
+        clauses = ", ".join(
+            f"MODIFY {column} {type_.compile(dialect=dialect)} NULL"
+            for column, type_ in types.items()
+        )
+        op.execute(f"ALTER TABLE {table_name} {clauses}")
+        return
+
+    for column, type_ in types.items():
+        op.alter_column(
+            table_name,
+            column,
+            existing_type=existing_types[column],
+            type_=type_,
+            existing_nullable=True,
+        )
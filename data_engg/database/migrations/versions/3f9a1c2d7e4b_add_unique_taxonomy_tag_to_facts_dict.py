@@ -0,0 +1,45 @@
+"""add_unique_taxonomy_tag_to_facts_dict
+
+Revision ID: 3f9a1c2d7e4b
+Revises: c7d4e5f6a8b9
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c2d7e4b"
+down_revision: Union[str, None] = "c7d4e5f6a8b9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep the oldest row of any duplicated (taxonomy, tag) before adding the key
+    op.execute(
+        """
+        DELETE d1 FROM bronze_sec_facts_dict d1
+        JOIN bronze_sec_facts_dict d2
+            ON d1.taxonomy = d2.taxonomy AND d1.tag = d2.tag AND d1.id > d2.id
+        """
+    )
+
+    op.create_unique_constraint(
+        "uq_bronze_sec_facts_dict_taxonomy_tag",
+        "bronze_sec_facts_dict",
+        ["taxonomy", "tag"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(
+        "uq_bronze_sec_facts_dict_taxonomy_tag",
+        "bronze_sec_facts_dict",
+        type_="unique",
+    )
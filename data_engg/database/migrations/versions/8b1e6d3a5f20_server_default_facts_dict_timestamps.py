@@ -0,0 +1,44 @@
+"""server_default_facts_dict_timestamps
+
+Revision ID: 8b1e6d3a5f20
+Revises: 3f9a1c2d7e4b
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8b1e6d3a5f20"
+down_revision: Union[str, None] = "3f9a1c2d7e4b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Let the database stamp the audit columns instead of the client
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "bronze_sec_facts_dict",
+            column,
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in ("created_at", "updated_at"):
+        op.alter_column(
+            "bronze_sec_facts_dict",
+            column,
+            existing_type=sa.DateTime(),
+            nullable=False,
+            server_default=None,
+        )
@@ -0,0 +1,36 @@
+"""add_accn_and_filing_date_indexes
+
+Revision ID: a6b2e9d4c873
+Revises: f1c4d7a9b286
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a6b2e9d4c873"
+down_revision: Union[str, None] = "f1c4d7a9b286"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_bronze_sec_facts_accn", "bronze_sec_facts", ["accn"])
+    op.create_index(
+        "ix_bronze_sec_submissions_filing_date",
+        "bronze_sec_submissions",
+        ["filing_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_bronze_sec_submissions_filing_date", table_name="bronze_sec_submissions"
+    )
+    op.drop_index("ix_bronze_sec_facts_accn", table_name="bronze_sec_facts")
@@ -0,0 +1,38 @@
+"""narrow_submissions_text_columns
+
+Revision ID: b7e2f4c1d963
+Revises: a6b2e9d4c873
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from database.migrations.helpers import modify_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7e2f4c1d963"
+down_revision: Union[str, None] = "a6b2e9d4c873"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Remaining free-form columns moved from TEXT to VARCHAR
+NARROWED_COLUMNS = {
+    "items": sa.String(length=512),
+    "primary_doc_description": sa.String(length=512),
+}
+TEXT_COLUMNS = {column: sa.Text() for column in NARROWED_COLUMNS}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    modify_columns("bronze_sec_submissions", NARROWED_COLUMNS, TEXT_COLUMNS)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    modify_columns("bronze_sec_submissions", TEXT_COLUMNS, NARROWED_COLUMNS)
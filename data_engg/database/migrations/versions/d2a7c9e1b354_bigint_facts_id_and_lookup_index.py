@@ -0,0 +1,51 @@
+"""bigint_facts_id_and_lookup_index
+
+Revision ID: d2a7c9e1b354
+Revises: 8b1e6d3a5f20
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d2a7c9e1b354"
+down_revision: Union[str, None] = "8b1e6d3a5f20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "bronze_sec_facts",
+        "id",
+        existing_type=sa.Integer(),
+        type_=sa.BigInteger(),
+        existing_nullable=False,
+        autoincrement=True,
+    )
+
+    op.create_index(
+        "ix_bronze_sec_facts_cik_tag_end",
+        "bronze_sec_facts",
+        ["cik", "tag", "end_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_bronze_sec_facts_cik_tag_end", table_name="bronze_sec_facts")
+
+    op.alter_column(
+        "bronze_sec_facts",
+        "id",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        autoincrement=True,
+    )
@@ -0,0 +1,41 @@
+"""fy_as_smallint
+
+Revision ID: e5f3b8a2c917
+Revises: d2a7c9e1b354
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f3b8a2c917"
+down_revision: Union[str, None] = "d2a7c9e1b354"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        "bronze_sec_facts",
+        "fy",
+        existing_type=sa.Numeric(),
+        type_=sa.SmallInteger(),
+        existing_nullable=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "bronze_sec_facts",
+        "fy",
+        existing_type=sa.SmallInteger(),
+        type_=sa.Numeric(),
+        existing_nullable=True,
+    )
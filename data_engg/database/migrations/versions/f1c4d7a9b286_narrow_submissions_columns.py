@@ -0,0 +1,52 @@
+"""narrow_submissions_columns
+
+Revision ID: f1c4d7a9b286
+Revises: e5f3b8a2c917
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from database.migrations.helpers import modify_columns
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c4d7a9b286"
+down_revision: Union[str, None] = "e5f3b8a2c917"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Short code columns moved from TEXT to VARCHAR
+NARROWED_COLUMNS = {
+    "act": sa.String(length=32),
+    "form": sa.String(length=16),
+    "file_number": sa.String(length=32),
+    "primary_document": sa.String(length=255),
+}
+TEXT_COLUMNS = {column: sa.Text() for column in NARROWED_COLUMNS}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    modify_columns("bronze_sec_submissions", NARROWED_COLUMNS, TEXT_COLUMNS)
+
+    op.create_index(
+        "ix_bronze_sec_submissions_form_filing_date",
+        "bronze_sec_submissions",
+        ["form", "filing_date"],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ix_bronze_sec_submissions_form_filing_date",
+        table_name="bronze_sec_submissions",
+    )
+
+    modify_columns("bronze_sec_submissions", TEXT_COLUMNS, NARROWED_COLUMNS)
@@ -1,4 +1,5 @@
 # Models package
-from .sec_facts_raw import Base, BronzeSecFacts, BronzeSecFactsDict
+from .base import Base
+from .sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
 
 __all__ = ["Base", "BronzeSecFacts", "BronzeSecFactsDict"]
@@ -0,0 +1,17 @@
+from sqlalchemy.orm import declarative_base
+
+# Shared declarative Base; every model module registers its tables on this
+# one MetaData so a single create_all/drop_all covers the whole schema
+Base = declarative_base()
+
+# Table options shared by every model. Explicit InnoDB/utf8mb4 options keep
+# TiDB/MySQL DDL from falling back to server defaults; utf8mb4_bin matches
+# TiDB's default collation (no charset conversion or case folding on the
+# bulk-insert path) and DYNAMIC keeps short TEXT values inline in the row
+TABLE_OPTIONS = {
+    "mysql_engine": "InnoDB",
+    "mysql_charset": "utf8mb4",
+    "mysql_collate": "utf8mb4_bin",
+    "mysql_row_format": "DYNAMIC",
+    "extend_existing": True,
+}
@@ -1,8 +1,19 @@
-from sqlalchemy import Column, Integer, String, Date, Numeric, Text, DateTime
-from sqlalchemy.orm import declarative_base
-from datetime import datetime
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Index,
+    Integer,
+    String,
+    Date,
+    Numeric,
+    SmallInteger,
+    Text,
+    DateTime,
+    UniqueConstraint,
+    func,
+)
 
-Base = declarative_base()
+from .base import Base, TABLE_OPTIONS
 
 
 class BronzeSecFacts(Base):
@@ -10,13 +21,17 @@ class BronzeSecFacts(Base):
 
     __tablename__ = "bronze_sec_facts"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    # BIGINT: facts across all CIKs can outgrow a 32-bit counter
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
     cik = Column(String(13), nullable=False)
     taxonomy = Column(String(64), nullable=False)
     tag = Column(String(256), nullable=False)
     unit = Column(String(32), nullable=False)
-    val = Column(Numeric(precision=30, scale=2), nullable=False)
-    fy = Column(Numeric, nullable=True)
+    # Stored exactly as DECIMAL; read back as float since analytics convert
+    # anyway (asdecimal=False skips a Decimal per row)
+    val = Column(Numeric(precision=30, scale=2, asdecimal=False), nullable=False)
+    # Fiscal year; a small integer, so reads skip Decimal conversion
+    fy = Column(SmallInteger, nullable=True)
     fp = Column(String(8), nullable=True)
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
@@ -25,7 +40,13 @@ class BronzeSecFacts(Base):
     filed = Column(Date, nullable=True)
     accn = Column(String(32), nullable=True)
 
-    __table_args__ = {"extend_existing": True}
+    # Downstream jobs look facts up by company and concept over time, and
+    # dedupe / join to filings by accession number
+    __table_args__ = (
+        Index("ix_bronze_sec_facts_cik_tag_end", "cik", "tag", "end_date"),
+        Index("ix_bronze_sec_facts_accn", "accn"),
+        TABLE_OPTIONS,
+    )
 
     def __repr__(self):
         return f"<BronzeSecFacts(id={self.id}, cik={self.cik}, tag={self.tag}, val={self.val})>"
@@ -44,14 +65,21 @@ class BronzeSecFactsDict(Base):
     label = Column(Text, nullable=True)
     description = Column(Text, nullable=True)
 
-    # Audit attributes
+    # Audit attributes; stamped by the database (server default on insert,
+    # NOW() rendered into UPDATE statements) so no per-row Python values are sent
     id = Column(Integer, primary_key=True, autoincrement=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(
-        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+        DateTime, nullable=False, server_default=func.now(), onupdate=func.now()
     )
 
-    __table_args__ = {"extend_existing": True}
+    # One row per (taxonomy, tag); lets inserts skip or upsert existing tags
+    __table_args__ = (
+        UniqueConstraint(
+            "taxonomy", "tag", name="uq_bronze_sec_facts_dict_taxonomy_tag"
+        ),
+        TABLE_OPTIONS,
+    )
 
     def __repr__(self):
         return f"<BronzeSecFactsDict(id={self.id}, taxonomy={self.taxonomy}, tag={self.tag})>"
@@ -1,7 +1,14 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, Text, BigInteger
-from sqlalchemy.orm import declarative_base
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    DateTime,
+    BigInteger,
+    Index,
+)
 
-Base = declarative_base()
+from .base import Base, TABLE_OPTIONS
 
 
 class BronzeSecSubmissions(Base):
@@ -15,20 +22,27 @@ class BronzeSecSubmissions(Base):
     filing_date = Column(Date, primary_key=True, nullable=False)
     acceptance_datetime = Column(DateTime, primary_key=True, nullable=False)
 
-    # Additional data fields
+    # Additional data fields; EDGAR bounds all of these well under 512 chars,
+    # so they are VARCHAR to stay in the row and remain indexable
     report_date = Column(Date, nullable=True)
-    act = Column(Text, nullable=True)
-    form = Column(Text, nullable=True)
-    file_number = Column(Text, nullable=True)
+    act = Column(String(32), nullable=True)
+    form = Column(String(16), nullable=True)
+    file_number = Column(String(32), nullable=True)
     film_number = Column(BigInteger, nullable=True)
-    items = Column(Text, nullable=True)
+    items = Column(String(512), nullable=True)
     size = Column(Integer, nullable=True)
     is_xbrl = Column(Integer, nullable=True)
     is_inline_xbrl = Column(Integer, nullable=True)
-    primary_document = Column(Text, nullable=True)
-    primary_doc_description = Column(Text, nullable=True)
-
-    __table_args__ = {"extend_existing": True}
+    primary_document = Column(String(255), nullable=True)
+    primary_doc_description = Column(String(512), nullable=True)
+
+    # filing_date is third in the primary key, so date-range scans across
+    # companies need their own index
+    __table_args__ = (
+        Index("ix_bronze_sec_submissions_form_filing_date", "form", "filing_date"),
+        Index("ix_bronze_sec_submissions_filing_date", "filing_date"),
+        TABLE_OPTIONS,
+    )
 
     def __repr__(self):
         return f"<BronzeSecSubmissions(cik={self.cik}, accession_number={self.accession_number}, form={self.form})>"
@@ -0,0 +1,120 @@
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Date,
+    Numeric,
+    DECIMAL,
+    Text,
+    DateTime,
+    BigInteger,
+    Index,
+)
+
+from .base import Base, TABLE_OPTIONS
+
+
+class Sp500StockData(Base):
+    """S&P 500 Stock Data Table"""
+
+    __tablename__ = "sp500_stooq_ohcl"
+
+    ticker = Column(String(10), primary_key=True, nullable=False)
+    date = Column(Date, primary_key=True, nullable=False)
+    # Prices are read back as floats (asdecimal=False) instead of Decimals
+    open = Column(Numeric(precision=15, scale=4, asdecimal=False), nullable=True)
+    high = Column(Numeric(precision=15, scale=4, asdecimal=False), nullable=True)
+    low = Column(Numeric(precision=15, scale=4, asdecimal=False), nullable=True)
+    close = Column(Numeric(precision=15, scale=4, asdecimal=False), nullable=True)
+    volume = Column(BigInteger, nullable=True)
+
+    # The (ticker, date) primary key can't serve date-range scans across tickers
+    __table_args__ = (
+        Index("ix_sp500_stooq_ohcl_date", "date"),
+        TABLE_OPTIONS,
+    )
+
+    def __repr__(self):
+        return f"<Sp500StockData(ticker={self.ticker}, date={self.date}, close={self.close})>"
+
+
+class Sp500WikiList(Base):
+    """S&P 500 Wiki List Table"""
+
+    __tablename__ = "sp500_wik_list"
+
+    symbol = Column(String(10), primary_key=True, nullable=False)
+    date_added = Column(Date, primary_key=True, nullable=False)
+    security = Column(String(255), nullable=True)
+    gics_sector = Column(String(255), nullable=True)
+    gics_sub_ind = Column(String(255), nullable=True)
+    headquarters_loc = Column(String(255), nullable=True)
+    cik = Column(String(20), nullable=True)
+    founded = Column(String(50), nullable=True)
+
+    __table_args__ = TABLE_OPTIONS
+
+    def __repr__(self):
+        return f"<Sp500WikiList(symbol={self.symbol}, date_added={self.date_added}, security={self.security})>"
+
+
+class Sp500ComponentChanges(Base):
+    """S&P 500 Component Changes Table"""
+
+    __tablename__ = "selected_changes_sp500"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    effective_date = Column(Date, nullable=False)
+    added_ticker = Column(String(10), nullable=True)
+    added_security = Column(String(255), nullable=True)
+    removed_ticker = Column(String(10), nullable=True)
+    removed_security = Column(String(255), nullable=True)
+    reason = Column(Text, nullable=True)
+
+    __table_args__ = TABLE_OPTIONS
+
+    def __repr__(self):
+        return f"<Sp500ComponentChanges(effective_date={self.effective_date}, added_ticker={self.added_ticker}, removed_ticker={self.removed_ticker})>"
+
+
+class Sp500FinnhubNews(Base):
+    """S&P 500 Finnhub News Table"""
+
+    __tablename__ = "sp500_finnhub_news"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(10), nullable=False)
+    news_id = Column(String(50), nullable=False)
+    datetime = Column(DateTime, nullable=False)
+    headline = Column(Text, nullable=True)
+    summary = Column(Text, nullable=True)
+    source = Column(String(200), nullable=True)
+    url = Column(Text, nullable=True)
+    image = Column(Text, nullable=True)
+    related = Column(String(10), nullable=True)
+    category = Column(String(100), nullable=True)
+
+    __table_args__ = TABLE_OPTIONS
+
+    def __repr__(self):
+        return f"<Sp500FinnhubNews(symbol={self.symbol}, datetime={self.datetime}, headline={self.headline[:50]}...)>"
+
+
+class Sp500CorporateActions(Base):
+    """S&P 500 Corporate Actions Table"""
+
+    __tablename__ = "sp500_corporate_actions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    symbol = Column(String(10), nullable=False)
+    event_type = Column(String(50), nullable=False)
+    ex_date = Column(Date, nullable=True)
+    record_date = Column(Date, nullable=True)
+    pay_date = Column(Date, nullable=True)
+    ratio = Column(String(50), nullable=True)
+    cash_amount = Column(DECIMAL(15, 6), nullable=True)
+
+    __table_args__ = TABLE_OPTIONS
+
+    def __repr__(self):
+        return f"<Sp500CorporateActions(id={self.id}, symbol={self.symbol}, ex_date={self.ex_date}, event_type={self.event_type})>"
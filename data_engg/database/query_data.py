@@ -30,7 +30,7 @@ sys.path.insert(0, str(data_engg_root))
 
 # Import database modules
 try:
-    from database.db_connection import engine, Session
+    from database.db_connection import get_engine, get_read_only_session_factory
     from database.config.config import Config
     from database.models.sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
     from database.models.sec_submissions_raw import BronzeSecSubmissions
@@ -43,17 +43,26 @@ except ImportError as e:
     sys.exit(1)
 
 
+# Fixed statements are built once at import instead of on every call
+_CONNECTION_INFO = text("SELECT 1 as test, DATABASE() as db_name")
+_TABLES_OVERVIEW = text(
+    """
+    SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH
+    FROM information_schema.TABLES
+    WHERE TABLE_SCHEMA = DATABASE()
+    ORDER BY TABLE_NAME
+"""
+)
+
+
 def test_database_connection():
     """Test database connection and display basic info"""
     try:
-        with Session() as session:
-            # Test basic connection
-            result = session.execute(text("SELECT 1 as test")).fetchone()
-            print(f"Database connection successful: {result[0]}")
-
-            # Get database info
-            db_info = session.execute(text("SELECT DATABASE() as db_name")).fetchone()
-            print(f"Connected to database: {db_info[0]}")
+        with get_read_only_session_factory()() as session:
+            # Test basic connection and get database info in one round trip
+            result = session.execute(_CONNECTION_INFO).fetchone()
+            print(f"Database connection successful: {result.test}")
+            print(f"Connected to database: {result.db_name}")
 
             return True
     except Exception as e:
@@ -64,24 +73,14 @@ def test_database_connection():
 def get_table_info():
     """Get information about all tables in the database"""
     try:
-        with Session() as session:
-            # Get all table names
-            tables_query = text(
-                """
-                SELECT TABLE_NAME, TABLE_ROWS, DATA_LENGTH, INDEX_LENGTH
-                FROM information_schema.TABLES 
-                WHERE TABLE_SCHEMA = DATABASE()
-                ORDER BY TABLE_NAME
-            """
-            )
+        # Get all table names
+        tables_df = pd.read_sql(_TABLES_OVERVIEW, get_engine())
 
-            tables_df = pd.read_sql(tables_query, engine)
+        print("Database Tables Overview:")
+        print("=" * 60)
+        print(tables_df.to_string(index=False))
 
-            print("Database Tables Overview:")
-            print("=" * 60)
-            print(tables_df.to_string(index=False))
-
-            return tables_df
+        return tables_df
     except Exception as e:
         print(f"Error getting table info: {e}")
         return None
@@ -90,7 +89,7 @@ def get_table_info():
 def get_record_counts():
     """Get record counts for main database tables"""
     try:
-        with Session() as session:
+        with get_read_only_session_factory()() as session:
             counts = {}
 
             # Count BronzeSecFacts
@@ -141,7 +140,7 @@ def execute_sql_query(query: str, return_df: bool = True, limit: int = 1000):
         pandas DataFrame or list of results
     """
     try:
-        with Session() as session:
+        with get_read_only_session_factory()() as session:
             # Add LIMIT if not present and query is SELECT
             if (
                 query.strip().upper().startswith("SELECT")
@@ -155,7 +154,7 @@ def execute_sql_query(query: str, return_df: bool = True, limit: int = 1000):
 
             if return_df:
                 # Use raw connection for pandas compatibility
-                raw_connection = engine.raw_connection()
+                raw_connection = get_engine().raw_connection()
                 result_df = pd.read_sql(query, raw_connection)
                 raw_connection.close()
                 print(f"Query executed successfully - {len(result_df)} rows returned")
@@ -170,11 +169,17 @@ def execute_sql_query(query: str, return_df: bool = True, limit: int = 1000):
         return None
 
 
+# Rows per to_sql batch; large batches cut per-statement round trips
+TO_SQL_CHUNKSIZE = 50000
+
+
 def insert_dataframe_to_table(
     df: pd.DataFrame, table_name: str, if_exists: str = "append"
 ):
     """
-    Insert a pandas DataFrame into a database table
+    Insert a pandas DataFrame into a database table. Each chunk is a plain
+    executemany, which PyMySQL rewrites into multi-row INSERT statements
+    without compiling one huge VALUES clause per chunk.
 
     Args:
         df: pandas DataFrame to insert
@@ -187,11 +192,10 @@ def insert_dataframe_to_table(
     try:
         rows_inserted = df.to_sql(
             table_name,
-            engine,
+            get_engine(),
             if_exists=if_exists,
             index=False,
-            method="multi",
-            chunksize=1000,
+            chunksize=TO_SQL_CHUNKSIZE,
         )
         print(f"Successfully inserted {len(df)} rows into {table_name}")
         return len(df)
@@ -200,9 +204,11 @@ def insert_dataframe_to_table(
         return 0
 
 
-def bulk_insert_records(records: List[Dict], model_class, batch_size: int = 1000):
+def bulk_insert_records(records: List[Dict], model_class, batch_size: int = 10000):
     """
-    Bulk insert records using SQLAlchemy ORM (based on test_json_to_db.py logic)
+    Bulk insert records with a Core executemany INSERT, without building a
+    model instance per record; PyMySQL sends each batch as multi-row
+    INSERT ... VALUES statements. All batches share one transaction.
 
     Args:
         records: List of dictionaries representing records
@@ -213,24 +219,19 @@ def bulk_insert_records(records: List[Dict], model_class, batch_size: int = 1000
         Number of records inserted
     """
     try:
-        with Session() as session:
-            total_inserted = 0
+        insert_stmt = model_class.__table__.insert()
+        total_inserted = 0
 
+        with get_engine().begin() as conn:
             for i in range(0, len(records), batch_size):
                 batch = records[i : i + batch_size]
-
-                # Create model instances
-                model_instances = [model_class(**record) for record in batch]
-
-                # Bulk insert
-                session.bulk_save_objects(model_instances)
-                session.commit()
+                conn.execute(insert_stmt, batch)
 
                 total_inserted += len(batch)
                 print(f"Inserted batch {i//batch_size + 1}: {len(batch)} records")
 
-            print(f"Total records inserted: {total_inserted}")
-            return total_inserted
+        print(f"Total records inserted: {total_inserted}")
+        return total_inserted
 
     except Exception as e:
         print(f"Error in bulk insert: {e}")
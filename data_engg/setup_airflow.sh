@@ -73,6 +73,10 @@ else
     echo -e "${GREEN}Admin user created with password: $AIRFLOW_ADMIN_PASSWORD${NC}"
 fi
 
+# Create the pool that bounds SP500 ingestion task concurrency
+echo -e "${GREEN}Creating sp500_ingest pool...${NC}"
+airflow pools set sp500_ingest 4 "SP500 ingestion tasks"
+
 # Create dags directory if it doesn't exist
 mkdir -p "$AIRFLOW_HOME/dags"
 
@@ -100,11 +100,9 @@ def create_tables_directly(tables_to_create):
 
         print("Creating tables directly using SQLAlchemy...")
 
-        # Import all models to ensure they're registered
-        from database.models.sec_facts_raw import Base as FactsBase
+        # Import all models to ensure they're registered on the shared Base
+        from database.models.base import Base
         from database.models.sec_facts_raw import BronzeSecFacts, BronzeSecFactsDict
-
-        from database.models.sec_submissions_raw import Base as SubmissionsBase
         from database.models.sec_submissions_raw import BronzeSecSubmissions
 
         # Create tables based on what's needed
@@ -113,11 +111,14 @@ def create_tables_directly(tables_to_create):
             for table in ["bronze_sec_facts", "bronze_sec_facts_dict"]
         ):
             print("Creating facts tables...")
-            FactsBase.metadata.create_all(engine)
+            Base.metadata.create_all(
+                engine,
+                tables=[BronzeSecFacts.__table__, BronzeSecFactsDict.__table__],
+            )
 
         if "bronze_sec_submissions" in tables_to_create:
             print("Creating submissions table...")
-            SubmissionsBase.metadata.create_all(engine)
+            Base.metadata.create_all(engine, tables=[BronzeSecSubmissions.__table__])
 
         print("✓ Tables created successfully!")
         return True
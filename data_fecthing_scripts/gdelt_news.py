@@ -1,7 +1,11 @@
-# pip install requests pandas python-dateutil trafilatura pyarrow
-import requests, time, math, re, pandas as pd
+# pip install requests pandas python-dateutil trafilatura pyarrow pyahocorasick
+import requests, time, math, re, threading, pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import chain, zip_longest
+from urllib.parse import urlparse
 from dateutil.relativedelta import relativedelta
+import ahocorasick
 import trafilatura
 
 # ---- CONFIG ----
@@ -15,6 +19,10 @@ DOMAINS = [
 ]
 API = "https://api.gdeltproject.org/api/v2/doc/doc"
 MAXREC = 250  # GDELT cap per call
+FETCH_WORKERS = 64  # concurrent article downloads
+PER_HOST_LIMIT = 4  # concurrent downloads per host, to avoid rate limits
+
+session = requests.Session()  # reuses TCP/TLS connections across GDELT calls
 
 def gdelt_fetch(domain, start, end):
   """Fetch up to MAXREC articles for domain/time window."""
@@ -27,7 +35,7 @@ def gdelt_fetch(domain, start, end):
     "enddatetime":   end.strftime("%Y%m%d%H%M%S"),
     "sort": "DateAsc"
   }
-  r = requests.get(API, params=params, timeout=60)
+  r = session.get(API, params=params, timeout=60)
   r.raise_for_status()
   return r.json().get("articles", [])
 
@@ -68,14 +76,30 @@ meta = pd.DataFrame(all_rows).drop_duplicates(subset=["url"])
 # columns typically: url, title, seendate, domain, language, sourcecountry
 
 # 2) Extract article content (best-effort; paywalls may return empty)
+urls = meta["url"].tolist()
+by_host = {}  # host -> row positions of its urls, in order
+for i, u in enumerate(urls):
+  by_host.setdefault(urlparse(u).netloc, []).append(i)
+host_limits = {host: threading.BoundedSemaphore(PER_HOST_LIMIT) for host in by_host}
+# urls arrive grouped by domain; interleave them round-robin across hosts so the
+# pool's FIFO hand-out spreads workers over every site instead of queueing them
+# all on one host's semaphore
+order = [i for i in chain.from_iterable(zip_longest(*by_host.values())) if i is not None]
+
 def fetch_text(u):
   try:
-    downloaded = trafilatura.fetch_url(u, timeout=30)
+    with host_limits[urlparse(u).netloc]:
+      downloaded = trafilatura.fetch_url(u, timeout=30)
     return trafilatura.extract(downloaded, include_comments=False, include_tables=False) or ""
   except Exception:
     return ""
 
-meta["content"] = meta["url"].map(fetch_text)
+# downloads are network-bound, so fetch them on a thread pool
+content = [""] * len(urls)
+with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+  for i, text in zip(order, ex.map(fetch_text, (urls[i] for i in order))):
+    content[i] = text  # back at the row's original position
+meta["content"] = content
 
 # 3) Tag S&P 500 tickers
 sp = pd.read_html("https://en.wikipedia.org/wiki/List_of_S%26P_500_companies")[0]  # table
@@ -85,20 +109,27 @@ sp["Name"] = sp["Security"].astype(str)
 aliases = {row.Symbol: {row.Name, row.Name.replace(" Inc.", ""), row.Name.replace(", Inc.", "")}
            for _, row in sp.iterrows()}
 
+# one Aho-Corasick automaton over every ticker token and company name, so each
+# article is scanned once instead of once per ticker/alias
+patterns = {}
+for sym, names in aliases.items():
+  patterns.setdefault(f" {sym} ", set()).add(sym)  # exact ticker token
+  for nm in names:
+    if nm:
+      patterns.setdefault(nm.upper(), set()).add(sym)  # company name substring
+matcher = ahocorasick.Automaton()
+for word, syms in patterns.items():
+  matcher.add_word(word, frozenset(syms))
+matcher.make_automaton()
+
 def find_tickers(title, content):
   txt = f" {str(title)} {str(content)} ".upper()
   hits = set()
-  for sym, names in aliases.items():
-    # exact ticker token OR company name substring
-    if f" {sym} " in txt:
-      hits.add(sym)
-    else:
-      for nm in names:
-        if nm and nm.upper() in txt:
-          hits.add(sym)
+  for _, syms in matcher.iter(txt):
+    hits.update(syms)
   return sorted(hits)
 
-meta["tickers"] = meta.apply(lambda r: find_tickers(r.get("title",""), r.get("content","")), axis=1)
+meta["tickers"] = [find_tickers(t, c) for t, c in zip(meta["title"], meta["content"])]
 out = meta[meta["tickers"].map(len) > 0].copy()
 
 # 4) Final tidy dataframe + CSV